@@ -2,58 +2,66 @@
 
 from __future__ import annotations
 import os
+from dataclasses import dataclass, field
 from pathlib import Path
 import logging
 from dotenv import load_dotenv
 
 
 # ----------------------------
-# LOAD ENVIRONMENT VARIABLES
+# SETTINGS (loaded once, immutable)
 # ----------------------------
-BASE_DIR = Path(__file__).resolve().parent.parent
-load_dotenv(BASE_DIR / ".env")
+@dataclass(frozen=True, slots=True)
+class Settings:
+    groq_api_key: str = field(repr=False)
 
-# ----------------------------
-# API KEYS
-# ----------------------------
-GROQ_API_KEY = os.getenv("GROQ_API_KEY")
+    # Paths (relative to project folder)
+    base_dir: Path
+    projects_root: Path      # where PDFs are downloaded
+    base_output_dir: Path    # where extracted outputs, logs, etc. are stored
+    cache_dir: Path          # reusable results (LLM answers, embeddings) across runs
 
-if not GROQ_API_KEY:
-    raise RuntimeError("GROQ_API_KEY not found in environment variables")
+    # Model configuration
+    similarity_threshold: float = 0.5
 
-os.environ["GROQ_API_KEY"] = GROQ_API_KEY
+    # Embeddings (good stable version for Windows)
+    embedding_model_name: str = "sentence-transformers/all-distilroberta-v1"
 
+    # Groq LLM (OSS-20B is correct for Groq)
+    groq_model_name: str = "openai/gpt-oss-20b"
 
-# ----------------------------
-# ----------------------------
-# PATHS (relative to project folder)
-# ----------------------------
-BASE_DIR = Path(__file__).resolve().parent.parent
-
-# Folder where PDFs will be downloaded
-PROJECTS_ROOT = BASE_DIR / "data" / "pdfs"
-PROJECTS_ROOT.mkdir(parents=True, exist_ok=True)
+    # spaCy model
+    spacy_model: str = "en_core_web_sm"
 
-# Folder where extracted outputs, logs, etc. are stored
-BASE_OUTPUT_DIR = BASE_DIR / "data" / "outputs"
-BASE_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    @classmethod
+    def load(cls) -> Settings:
+        """Load .env, validate required keys and create the data folders."""
+        base_dir = Path(__file__).resolve().parent.parent
+        load_dotenv(base_dir / ".env")
 
+        groq_api_key = os.getenv("GROQ_API_KEY")
+        if not groq_api_key:
+            raise RuntimeError("GROQ_API_KEY not found in environment variables")
 
+        projects_root = base_dir / "data" / "pdfs"
+        projects_root.mkdir(parents=True, exist_ok=True)
 
-# ----------------------------
-# MODEL CONFIGURATION
-# ----------------------------
-SIMILARITY_THRESHOLD = 0.5
+        base_output_dir = base_dir / "data" / "outputs"
+        base_output_dir.mkdir(parents=True, exist_ok=True)
 
-# Embeddings (good stable version for Windows)
-EMBEDDING_MODEL_NAME = "sentence-transformers/all-distilroberta-v1"
+        cache_dir = base_dir / "data" / "cache"
+        cache_dir.mkdir(parents=True, exist_ok=True)
 
+        return cls(
+            groq_api_key=groq_api_key,
+            base_dir=base_dir,
+            projects_root=projects_root,
+            base_output_dir=base_output_dir,
+            cache_dir=cache_dir,
+        )
 
-# Groq LLM (OSS-20B is correct for Groq)
-GROQ_MODEL_NAME = "openai/gpt-oss-20b"
 
-# spaCy model
-SPACY_MODEL = "en_core_web_sm"
+settings = Settings.load()
 
 
 # ----------------------------
@@ -1,77 +1,186 @@
 # downloadpdf.py
 
-import json
+import asyncio
+import logging
+import os
+import random
 import httpx
 from pathlib import Path
 
-
-BASE_DIR = Path(__file__).resolve().parent
-PROJECTDOCS_PATH = BASE_DIR / "projectdocs.json"
-PDF_BASE_DIR = BASE_DIR / "pdfs"
-
-
-async def download_file(client, url: str, save_path: Path):
-    """Download a single file and save to disk."""
-    try:
-        resp = await client.get(url, timeout=60)
-        resp.raise_for_status()
-        save_path.write_bytes(resp.content)
-        print(f"  📥 Saved: {save_path.name}")
-    except Exception as e:
-        print(f"  ❌ Failed to download {url}: {e}")
+from FilterDocs import find_project_docs
+from HttpClient import get_client, close_client
+from LogSetup import configure_logging
 
 
-async def download_all_for_project(project_key: str):
-    """Download all project docs for VCS_1566 (or any key)."""
+logger = logging.getLogger(__name__)
 
-    if not PROJECTDOCS_PATH.exists():
-        print("❌ projectdocs.json not found.")
-        return
 
-    data = json.loads(PROJECTDOCS_PATH.read_text(encoding="utf-8"))
-    docs_list = data.get("projectdocs", [])
+BASE_DIR = Path(__file__).resolve().parent
+PDF_BASE_DIR = BASE_DIR / "pdfs"
 
-    # Find matching object: { "VCS_1566": [docs...] }
-    project_entry = next((item for item in docs_list if project_key in item), None)
+# Max PDFs fetched at once per project (keeps the registry from rate-limiting us)
+MAX_CONCURRENT_DOWNLOADS = 8
+
+# Bytes held in memory per in-flight download
+CHUNK_SIZE = 64 * 1024
+
+# Retries for network errors, 429 and 5xx (exponential backoff with jitter)
+MAX_ATTEMPTS = 4
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 8.0
+
+# Characters not allowed in Windows/POSIX filenames (plus control chars) → "_"
+_ILLEGAL_FILENAME_CHARS = str.maketrans(
+    {c: "_" for c in '<>:"/\\|?*' + "".join(chr(i) for i in range(32))}
+)
+
+
+def safe_filename(name: str) -> str:
+    """Make a registry documentName safe to use as a local filename."""
+    name = (name or "").translate(_ILLEGAL_FILENAME_CHARS)
+    name = " ".join(name.split())
+    return name[:240]
+
+
+def _retry_delay(exc: Exception, attempt: int) -> float | None:
+    """Seconds to wait before retrying after exc, or None if it is not transient."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        resp = exc.response
+        if resp.status_code != 429 and resp.status_code < 500:
+            return None  # other 4xx won't fix themselves
+        retry_after = resp.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return min(float(retry_after), RETRY_MAX_DELAY)
+    elif not isinstance(exc, httpx.TransportError):
+        return None
+
+    backoff = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** (attempt - 1))
+    return backoff + random.uniform(0, RETRY_BASE_DELAY)
+
+
+def pdf_save_path(project_pdf_dir: Path, doc: dict) -> Path:
+    """Local path a registry doc is saved under (sanitized name, always .pdf)."""
+    filename = safe_filename(doc["documentName"])
+    if not filename.lower().endswith(".pdf"):
+        filename += ".pdf"
+    return project_pdf_dir / filename
+
+
+def all_pdfs_downloaded(project_key: str) -> bool:
+    """
+    True if every doc saved in projectdocs/ for this project is on disk
+    (trivially so for a saved, empty doc list: nothing to download).
+    Missing (e.g. previously failed) downloads return False so they are
+    retried; so does a project whose docs were never saved.
+    """
+    docs = find_project_docs(project_key)
+    if docs is None:
+        return False
+    if not docs:
+        return True
 
-    if not project_entry:
-        print(f"❌ No entry found for {project_key} in projectdocs.json")
+    project_pdf_dir = PDF_BASE_DIR / project_key
+    try:
+        with os.scandir(project_pdf_dir) as it:
+            # in-flight ".pdf.part" files never match a finished name
+            on_disk = {e.name for e in it if e.is_file()}
+    except FileNotFoundError:
+        return False
+    return all(pdf_save_path(project_pdf_dir, d).name in on_disk for d in docs)
+
+
+async def download_file(client, url: str, save_path: Path, sem: asyncio.Semaphore):
+    """Download a single file and save to disk, retrying transient failures."""
+    # Stream into a .part file so an interrupted download is never
+    # mistaken for a finished one by the "already exists" check.
+    tmp_path = save_path.with_name(save_path.name + ".part")
+
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        try:
+            async with sem:
+                logger.debug("  ↓ Downloading: %s", save_path.name)
+                async with client.stream("GET", url) as resp:
+                    resp.raise_for_status()
+                    with open(tmp_path, "wb") as f:
+                        async for chunk in resp.aiter_bytes(chunk_size=CHUNK_SIZE):
+                            # Disk writes run off the event loop so slow drives
+                            # don't stall the other in-flight downloads.
+                            await asyncio.to_thread(f.write, chunk)
+            tmp_path.replace(save_path)
+            logger.debug("  📥 Saved: %s", save_path.name)
+            return
+        except Exception as e:
+            tmp_path.unlink(missing_ok=True)
+            delay = _retry_delay(e, attempt)
+            if delay is None or attempt == MAX_ATTEMPTS:
+                logger.error("  ❌ Failed to download %s: %s", url, e)
+                return
+            logger.warning(
+                "  🔁 Retry %d/%d for %s in %.1fs (%s)",
+                attempt, MAX_ATTEMPTS - 1, save_path.name, delay, e,
+            )
+            # Sleep outside the semaphore so the slot goes to another download
+            await asyncio.sleep(delay)
+
+
+async def download_all_for_project(project_key: str, client: httpx.AsyncClient | None = None):
+    """
+    Download all project docs for VCS_1566 (or any key).
+    Uses the shared client from get_client() unless one is passed in.
+    """
+
+    docs = find_project_docs(project_key)
+
+    if docs is None:
+        logger.error("❌ No saved docs found for %s in projectdocs/", project_key)
         return
 
-    docs = project_entry[project_key]
-
     # Create folder: pdfs/VCS_1566/
     project_pdf_dir = PDF_BASE_DIR / project_key
     project_pdf_dir.mkdir(parents=True, exist_ok=True)
 
-    print(f"\n📂 Downloading PDFs for {project_key}")
-    print(f"📁 Saving into: {project_pdf_dir}")
+    logger.info("📂 Downloading PDFs for %s into %s", project_key, project_pdf_dir)
 
-    async with httpx.AsyncClient(follow_redirects=True) as client:
-        for doc in docs:
-            url = doc["uri"]
-            filename = doc["documentName"]
+    if client is None:
+        client = await get_client()
 
-            # Ensure filename ends with `.pdf`
-            if not filename.lower().endswith(".pdf"):
-                filename += ".pdf"
+    sem = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
+    tasks = []
+    # Docs whose names sanitize to the same file are fetched once; two tasks
+    # on one path would race on the same .part file.
+    scheduled: set[Path] = set()
+    for doc in docs:
+        url = doc["uri"]
+        save_path = pdf_save_path(project_pdf_dir, doc)
+        filename = save_path.name
 
-            save_path = project_pdf_dir / filename
+        # Skip already downloaded files (no task is scheduled for them)
+        if save_path.exists():
+            logger.debug("  ⏩ Already exists: %s", filename)
+            continue
 
-            # Skip already downloaded files
-            if save_path.exists():
-                print(f"  ⏩ Already exists: {filename}")
-                continue
+        if save_path in scheduled:
+            logger.debug("  ⏩ Duplicate name, already scheduled: %s", filename)
+            continue
 
-            print(f"  ↓ Downloading: {filename}")
-            await download_file(client, url, save_path)
+        scheduled.add(save_path)
+        tasks.append(download_file(client, url, save_path, sem))
 
-    print("\n✅ Completed!")
+    await asyncio.gather(*tasks)
+
+    logger.info("✅ Completed %s (%d downloads)", project_key, len(tasks))
 
 
 # -------------------------------
 # Execute directly
 # -------------------------------
 if __name__ == "__main__":
-    import asyncio
-    asyncio.run(download_all_for_project("VCS_1566"))
+    configure_logging()
+
+    async def _main():
+        try:
+            await download_all_for_project("VCS_1566")
+        finally:
+            await close_client()
+
+    asyncio.run(_main())
@@ -1,173 +1,203 @@
 # filterdocs.py
 
+import logging
 import re
-import json
-from datetime import datetime
+import orjson
+from functools import lru_cache
 from pathlib import Path
 
+from LogSetup import configure_logging
+
+
+logger = logging.getLogger(__name__)
+
 
 # -------------------------------------------------------------
 # 0. BASE DIR (so it works no matter where you run from)
 # -------------------------------------------------------------
 BASE_DIR = Path(__file__).resolve().parent
+PROJECTS_DIR = BASE_DIR / "projects"
+PROJECTDOCS_DIR = BASE_DIR / "projectdocs"
+
+# Legacy single-file stores, split into the directories above on first use
 PROJECTS_PATH = BASE_DIR / "projects.json"
 PROJECTDOCS_PATH = BASE_DIR / "projectdocs.json"
 
 
 # -------------------------------------------------------------
-# 1. REGEX PATTERNS FOR TIER-1 DOCUMENTS
+# 1. TIER-1 CLASSIFIER (single regex pass per documentType)
 # -------------------------------------------------------------
-TIER1_PATTERNS = {
-    "project_description": re.compile(r"project\s*description", re.I),
-    "monitoring_report": re.compile(r"monitor(ing)?\s*report", re.I),
-    "verification_report": re.compile(r"verif(ication)?\s*report", re.I),
-
-    "ccb_project_description": re.compile(r"ccb.*project\s*description", re.I),
-    "ccb_monitoring_report": re.compile(r"ccb.*monitor(ing)?\s*report", re.I),
-    "ccb_verification_report": re.compile(r"ccb.*verif(ication)?\s*report", re.I),
-
-    "sdv_project_description": re.compile(r"sd\s*vista.*project\s*description", re.I),
-    "sdv_monitoring_report": re.compile(r"sd\s*vista.*monitor(ing)?\s*report", re.I),
-}
-
-
-def is_tier1_doc(doc_type: str) -> bool:
-    """Return True if document type is Tier-1."""
-    for regex in TIER1_PATTERNS.values():
-        if regex.search(doc_type):
-            return True
-    return False
+# Only these document types are Tier-1 at all.
+TIER1_GATE = r"project\s*description|monitor(?:ing)?\s*report|verif(?:ication)?\s*report"
+
+# Ordered (category, pattern) rules; the first rule that matches from the
+# start of the documentType wins. SD VISta first, then CCB (type starts
+# with "CCB"), then the general VCS categories.
+TIER1_RULES = [
+    ("sdv_monitoring_report",   r"(?=.*sd\s*vista).*monitor"),
+    ("sdv_project_description", r"(?=.*sd\s*vista).*project description"),
+    ("ccb_monitoring_report",   r"\s*ccb.*monitor"),
+    ("ccb_verification_report", r"\s*ccb.*verif"),
+    ("ccb_project_description", r"\s*ccb.*project description"),
+    ("monitoring_report",       r".*monitor"),
+    ("verification_report",     r".*verification"),
+    ("project_description",     r".*project description"),
+]
+
+# All rules folded into one alternation behind the gate; ``m.lastgroup``
+# is the matching category.
+TIER1_RE = re.compile(
+    rf"^(?=.*(?:{TIER1_GATE}))(?:"
+    + "|".join(f"(?P<{category}>{pattern})" for category, pattern in TIER1_RULES)
+    + ")",
+    re.I | re.S,
+)
+
+
+def tier1_key(doc_type: str) -> str | None:
+    """Return the Tier-1 category key for a documentType, or None."""
+    m = TIER1_RE.match(doc_type)
+    return m.lastgroup if m else None
 
 
 # -------------------------------------------------------------
-# 2. GROUP KEY FOR DOCUMENT TYPE
+# 2. FILTER + SELECT LATEST VERSION
 # -------------------------------------------------------------
-def group_key(doc_type: str) -> str | None:
-    """Normalize documentType into a category key."""
-    dt = doc_type.lower().strip()
-
-    # SD VISta-specific first (so they don't get picked by generic ones)
-    if "sd vista" in dt or "sdvista" in dt.replace(" ", ""):
-        if "monitor" in dt:
-            return "sdv_monitoring_report"
-        if "project description" in dt:
-            return "sdv_project_description"
-
-    # CCB-specific next
-    if dt.startswith("ccb"):
-        if "monitor" in dt:
-            return "ccb_monitoring_report"
-        if "verif" in dt:
-            return "ccb_verification_report"
-        if "project description" in dt:
-            return "ccb_project_description"
-
-    # General VCS
-    if "monitor" in dt:
-        return "monitoring_report"
-    if "verification report" in dt or "verification" in dt:
-        return "verification_report"
-    if "project description" in dt:
-        return "project_description"
-
-    return None
+# Registry timestamps are fixed-shape ISO-8601 in UTC with an optional fraction
+# ("2017-07-05T12:36:36.9Z"), so the string itself is a valid sort key.
+UPLOAD_DATE_RE = re.compile(r"\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d(?:\.\d+)?")
+
+
+@lru_cache(maxsize=4096)
+def parse_upload_date(ts_raw: str) -> str | None:
+    """
+    Return a lexicographically comparable key for an uploadDate like
+    '2017-07-05T12:36:36.9Z' (the timestamp minus its trailing Z); None if
+    malformed.
+    """
+    ts = ts_raw[:-1] if ts_raw.endswith("Z") else ts_raw
+    return ts if UPLOAD_DATE_RE.fullmatch(ts) else None
 
 
-# -------------------------------------------------------------
-# 3. FILTER + SELECT LATEST VERSION
-# -------------------------------------------------------------
 def filter_latest_tier1_docs(docs):
     """Return only Tier-1 docs, and only the latest version of each group."""
     grouped = {}
 
     for doc in docs:
-        dtype = doc.get("documentType", "")
-
-        if not is_tier1_doc(dtype):
-            continue
-
-        key = group_key(dtype)
+        key = tier1_key(doc.get("documentType", ""))
         if not key:
             continue
 
-        # Parse upload timestamp (strip trailing Z)
-        ts_raw = doc.get("uploadDate", "")
-        try:
-            ts = datetime.fromisoformat(ts_raw.replace("Z", ""))
-        except ValueError:
+        # Parse upload timestamp (docs from one batch upload share a timestamp)
+        ts_raw = doc.get("uploadDate") or ""
+        ts = parse_upload_date(ts_raw)
+        if ts is None:
             # If parsing fails, skip this doc
-            print(f"⚠️ Could not parse date '{ts_raw}' for doc {doc.get('documentName')}")
+            logger.warning("⚠️ Could not parse date '%s' for doc %s", ts_raw, doc.get("documentName"))
             continue
 
         # Keep only latest per type
-        if key not in grouped or ts > grouped[key]["ts"]:
-            grouped[key] = {"ts": ts, "doc": doc}
+        existing = grouped.get(key)
+        if existing is None or ts > existing[0]:
+            grouped[key] = (ts, doc)
 
-    return [entry["doc"] for entry in grouped.values()]
+    return [doc for _, doc in grouped.values()]
 
 
 # -------------------------------------------------------------
-# 4. SAVE INTO projectdocs.json (inside "projectdocs" array)
+# 3. LOAD / SAVE projectdocs/<project_key>.json (one file per project)
 # -------------------------------------------------------------
-def save_to_projectdocs(project_key: str, docs: list):
+def fold_keyed_list(items) -> dict:
+    """
+    Convert the old list-of-single-key-dicts layout
+    ([{"VCS_1566": ...}, {"VCS_9999": ...}]) into a plain dict.
+    Dicts are returned unchanged; later duplicates win.
+    """
+    if isinstance(items, dict):
+        return items
+    return {k: v for obj in items for k, v in obj.items()}
+
+
+def split_keyed_file(legacy_path: Path, top_key: str, out_dir: Path):
     """
-    Maintain structure:
-    {
-      "projectdocs": [
-        { "VCS_1566": [ ...docs... ] },
-        { "VCS_9999": [ ... ] }
-      ]
-    }
+    One-shot split of an old monolithic {top_key: {project_key: ...}} file
+    into out_dir/<project_key>.json. Existing per-project files are kept.
     """
-    if PROJECTDOCS_PATH.exists():
-        data = json.loads(PROJECTDOCS_PATH.read_text(encoding="utf-8"))
-    else:
-        data = {"projectdocs": []}
+    if not legacy_path.exists():
+        return
+
+    try:
+        data = orjson.loads(legacy_path.read_bytes())
+    except FileNotFoundError:
+        # A concurrent save (another project's thread) migrated it first
+        return
+
+    out_dir.mkdir(parents=True, exist_ok=True)
 
-    proj_list = data.get("projectdocs", [])
+    for project_key, value in fold_keyed_list(data.get(top_key, {})).items():
+        path = out_dir / f"{project_key}.json"
+        if not path.exists():
+            path.write_bytes(orjson.dumps(value, option=orjson.OPT_INDENT_2))
 
-    # Remove any existing entry with the same key (to overwrite cleanly)
-    proj_list = [obj for obj in proj_list if project_key not in obj]
+    legacy_path.unlink(missing_ok=True)
+    logger.info("🔀 Migrated %s → %s/", legacy_path.name, out_dir.name)
 
-    # Append new entry
-    proj_list.append({project_key: docs})
 
-    data["projectdocs"] = proj_list
+def migrate_projectdocs():
+    split_keyed_file(PROJECTDOCS_PATH, "projectdocs", PROJECTDOCS_DIR)
 
-    PROJECTDOCS_PATH.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
-    print(f"✅ Saved {len(docs)} filtered docs under '{project_key}' → {PROJECTDOCS_PATH.name}")
+
+def find_project_docs(project_key: str) -> list | None:
+    """Return the saved docs for one project, or None if it was never saved."""
+    migrate_projectdocs()
+
+    path = PROJECTDOCS_DIR / f"{project_key}.json"
+    if not path.exists():
+        return None
+    return orjson.loads(path.read_bytes())
+
+
+def save_to_projectdocs(project_key: str, docs: list):
+    """Write (or overwrite) projectdocs/<project_key>.json with the filtered docs."""
+    migrate_projectdocs()
+
+    PROJECTDOCS_DIR.mkdir(parents=True, exist_ok=True)
+    path = PROJECTDOCS_DIR / f"{project_key}.json"
+    path.write_bytes(orjson.dumps(docs, option=orjson.OPT_INDENT_2))
+    logger.info("✅ Saved %d filtered docs under '%s' → %s/%s", len(docs), project_key, PROJECTDOCS_DIR.name, path.name)
 
 
 # -------------------------------------------------------------
-# 5. MAIN EXECUTION
+# 4. MAIN EXECUTION
 # -------------------------------------------------------------
 def main():
-    if not PROJECTS_PATH.exists():
-        print(f"❌ ERROR: {PROJECTS_PATH.name} not found in {BASE_DIR}")
-        return
+    split_keyed_file(PROJECTS_PATH, "projects", PROJECTS_DIR)
 
-    # Load data
-    data = json.loads(PROJECTS_PATH.read_text(encoding="utf-8"))
+    # Example: projects/VCS_1566.json → { "resourceIdentifier": ..., "documents": [...] }
+    project_files = sorted(PROJECTS_DIR.glob("*.json")) if PROJECTS_DIR.exists() else []
+    if not project_files:
+        logger.error("❌ No project files found in %s", PROJECTS_DIR)
+        return
 
-    # Example: {"projects": [ { "VCS_1566": { ... } } ]}
-    proj_obj = data["projects"][0]
-    project_key = list(proj_obj.keys())[0]
+    project_key = project_files[0].stem
+    project = orjson.loads(project_files[0].read_bytes())
 
-    print(f"🔍 Processing project: {project_key}")
+    logger.info("🔍 Processing project: %s", project_key)
 
-    docs = proj_obj[project_key].get("documents", [])
+    docs = project.get("documents", [])
 
     # Apply filtering logic
     filtered_docs = filter_latest_tier1_docs(docs)
 
     # Print results
-    print("\n📌 Selected Tier-1 latest docs:")
+    logger.info("📌 Selected %d Tier-1 latest docs:", len(filtered_docs))
     for d in filtered_docs:
-        print(f" - {d['documentType']} → {d['documentName']} (uploaded {d['uploadDate']})")
+        logger.info(" - %s → %s (uploaded %s)", d["documentType"], d["documentName"], d["uploadDate"])
 
-    # Save to projectdocs.json
+    # Save to projectdocs/<project_key>.json
     save_to_projectdocs(project_key, filtered_docs)
 
 
 if __name__ == "__main__":
+    configure_logging()
     main()
@@ -0,0 +1,54 @@
+# httpclient.py
+
+import logging
+
+import httpx
+
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/123.0.0.0 Safari/537.36"
+    ),
+}
+
+# Shared client for the registry API and PDF downloads: keeps TCP/TLS
+# connections (and HTTP/2 sessions) alive across pipeline steps and projects
+_client: httpx.AsyncClient | None = None
+
+# Hosts whose negotiated protocol has already been reported
+_protocol_logged: set[str] = set()
+
+
+async def get_client() -> httpx.AsyncClient:
+    """Return the shared AsyncClient, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=True,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+            timeout=httpx.Timeout(60.0, connect=10.0),
+            headers=DEFAULT_HEADERS,
+        )
+    return _client
+
+
+def log_http_version_once(resp: httpx.Response):
+    """Log the negotiated protocol (HTTP/2 vs HTTP/1.1) the first time a host answers."""
+    host = resp.url.host
+    if host not in _protocol_logged:
+        _protocol_logged.add(host)
+        logger.info("🔌 %s negotiated %s", host, resp.http_version)
+
+
+async def close_client():
+    """Close the shared AsyncClient (call once before the event loop exits)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
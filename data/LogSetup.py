@@ -0,0 +1,15 @@
+# logsetup.py
+
+import logging
+import os
+
+
+def configure_logging():
+    """
+    One stderr handler for the data/ scripts. Level comes from DATA_LOG_LEVEL
+    (default INFO); set it to DEBUG to see per-file download lines.
+    """
+    logging.basicConfig(
+        level=os.environ.get("DATA_LOG_LEVEL", "INFO").upper(),
+        format="%(asctime)s %(levelname)s %(message)s",
+    )
@@ -1,71 +1,96 @@
 # data/Scraping.py
 
 import asyncio
-import json
+import logging
+import orjson
 from urllib.parse import urlparse
 from pathlib import Path
 import httpx
 
+from FilterDocs import split_keyed_file, tier1_key
+from HttpClient import get_client, close_client, log_http_version_once
+from LogSetup import configure_logging
+
+
+logger = logging.getLogger(__name__)
 
 API_BASE = "https://registry.verra.org/uiapi/resource/resourceSummary/"
-PROJECTS_FILE = Path(__file__).resolve().parent / "projects.json"
+BASE_DIR = Path(__file__).resolve().parent
+PROJECTS_DIR = BASE_DIR / "projects"
+
+# Legacy single-file store, split into PROJECTS_DIR on first use
+PROJECTS_FILE = BASE_DIR / "projects.json"
+
+
+def migrate_projects_file():
+    split_keyed_file(PROJECTS_FILE, "projects", PROJECTS_DIR)
+
 
+def project_exists(project_key: str) -> bool:
+    """Cheap check (no parse) for whether a project was already scraped."""
+    migrate_projects_file()
+    return (PROJECTS_DIR / f"{project_key}.json").exists()
 
-def load_projects_file():
-    """Load or initialize projects.json structure."""
-    if PROJECTS_FILE.exists():
-        with PROJECTS_FILE.open("r", encoding="utf-8") as f:
-            return json.load(f)
-    else:
-        return {"projects": []}
 
+def save_project(project_key: str, data: dict):
+    """Write (or overwrite) projects/<project_key>.json; other projects are untouched."""
+    migrate_projects_file()
 
-def save_projects_file(data):
-    """Save updated JSON back to projects.json."""
-    with PROJECTS_FILE.open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    PROJECTS_DIR.mkdir(parents=True, exist_ok=True)
+    path = PROJECTS_DIR / f"{project_key}.json"
+    path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
 
 
-# Extract specific attribute value from participation attributes
-def get_attr(attrs, code):
-    for item in attrs:
-        if item["code"] == code:
-            vals = item.get("values", [])
-            if vals:
-                return vals[0].get("value")
-    return None
+def index_attributes(attrs) -> dict:
+    """Map attribute code -> first value, in one pass over the attribute list."""
+    out = {}
+    for item in attrs or []:
+        vals = item.get("values")
+        if vals and item["code"] not in out:
+            out[item["code"]] = vals[0].get("value")
+    return out
 
 
-async def fetch_verra_json(app_url: str) -> dict:
-    parsed = urlparse(app_url)
-    parts = [p for p in parsed.path.split("/") if p]
-    project_id = parts[-1]
+def extract_project_id(app_url: str) -> str:
+    """".../app/projectDetail/VCS/1566" → "1566"."""
+    parts = [p for p in urlparse(app_url).path.split("/") if p]
+    return parts[-1]
+
+
+async def fetch_verra_json(app_url: str, client: httpx.AsyncClient | None = None) -> dict:
+    project_id = extract_project_id(app_url)
 
     api_url = f"{API_BASE}{project_id}"
-    print(f"🔗 Calling API URL: {api_url}")
-
-    headers = {
-        "Accept": "application/json",
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/123.0.0.0 Safari/537.36"
-        ),
-    }
+    logger.info("🔗 Calling API URL: %s", api_url)
 
-    async with httpx.AsyncClient(timeout=30, headers=headers) as client:
-        resp = await client.get(api_url)
-        print("HTTP status:", resp.status_code)
-        resp.raise_for_status()
-        return resp.json()
+    if client is None:
+        client = await get_client()
 
+    resp = await client.get(api_url, headers={"Accept": "application/json"}, timeout=30)
+    logger.info("HTTP status: %s", resp.status_code)
+    log_http_version_once(resp)
+    resp.raise_for_status()
+    # Parse the raw bytes directly (skips httpx's text decode + stdlib json)
+    return orjson.loads(resp.content)
 
-def rearrange(data: dict) -> dict:
-    """Return cleaned and reorganized structure."""
 
-    vcs = next((p for p in data["participationSummaries"] if p["programCode"] == "VCS"), None)
-    ccb = next((p for p in data["participationSummaries"] if p["programCode"] == "CCB"), None)
-    sdv = next((p for p in data["participationSummaries"] if p["programCode"] == "SDVISTA"), None)
+def rearrange(data: dict, tier1_only: bool = False) -> dict:
+    """
+    Return cleaned and reorganized structure.
+    With tier1_only=True, documents that are not Tier-1 are dropped while
+    flattening instead of being kept for the filter step to discard.
+    """
+
+    # Attributes per program (first summary per programCode wins)
+    by_code = {}
+    for p in data.get("participationSummaries", []):
+        code = p.get("programCode")
+        if code not in by_code:
+            by_code[code] = index_attributes(p.get("attributes"))
+
+    vcs = by_code.get("VCS", {})
+    ccb = by_code.get("CCB", {})
+    sdv = by_code.get("SDVISTA", {})
 
     result = {
         "resourceIdentifier": data.get("resourceIdentifier"),
@@ -74,16 +99,16 @@ def rearrange(data: dict) -> dict:
         "location": data.get("location"),
 
         # VCS values
-        "vcs_project_status": get_attr(vcs["attributes"], "PROJECT_STATUS") if vcs else None,
-        "estimated_annual_emission_reduction": get_attr(vcs["attributes"], "EST_ANNUAL_EMISSION_REDCT") if vcs else None,
-        "total_buffer_pool_credits": get_attr(vcs["attributes"], "TOTAL_BUFFER_POOL_CREDITS") if vcs else None,
-        "primary_project_category": get_attr(vcs["attributes"], "PRIMARY_PROJECT_CATEGORY_NAME") if vcs else None,
-        "subcategory": get_attr(vcs["attributes"], "PROJECT_SUBCATERGORY_NAMES") if vcs else None,
-        "project_acreage": get_attr(vcs["attributes"], "PROJECT_ACREAGE") if vcs else None,
+        "vcs_project_status": vcs.get("PROJECT_STATUS"),
+        "estimated_annual_emission_reduction": vcs.get("EST_ANNUAL_EMISSION_REDCT"),
+        "total_buffer_pool_credits": vcs.get("TOTAL_BUFFER_POOL_CREDITS"),
+        "primary_project_category": vcs.get("PRIMARY_PROJECT_CATEGORY_NAME"),
+        "subcategory": vcs.get("PROJECT_SUBCATERGORY_NAMES"),
+        "project_acreage": vcs.get("PROJECT_ACREAGE"),
 
         # Other standards project status
-        "ccb_project_status": get_attr(ccb["attributes"], "PROJECT_STATUS") if ccb else None,
-        "sdvista_project_status": get_attr(sdv["attributes"], "PROJECT_STATUS") if sdv else None,
+        "ccb_project_status": ccb.get("PROJECT_STATUS"),
+        "sdvista_project_status": sdv.get("PROJECT_STATUS"),
 
         # documents
         "documents": [],
@@ -92,6 +117,8 @@ def rearrange(data: dict) -> dict:
     all_docs = []
     for group in data.get("documentGroups", []):
         for d in group.get("documents", []):
+            if tier1_only and not tier1_key(d.get("documentType") or ""):
+                continue
             all_docs.append({
                 "uri": d.get("uri"),
                 "documentType": d.get("documentType"),
@@ -106,28 +133,37 @@ def rearrange(data: dict) -> dict:
 # -----------------------------
 # DIRECT EXECUTION
 # -----------------------------
-project_url = "https://registry.verra.org/app/projectDetail/VCS/1566"
+def main():
+    project_url = "https://registry.verra.org/app/projectDetail/VCS/1566"
+
+    logger.info("Fetching: %s", project_url)
+    async def _fetch_once():
+        try:
+            return await fetch_verra_json(project_url)
+        finally:
+            await close_client()
 
-print(f"Fetching: {project_url}")
-raw_json = asyncio.run(fetch_verra_json(project_url))
+    raw_json = asyncio.run(_fetch_once())
 
-print("\n⚙️ Rearranging JSON...")
-cleaned = rearrange(raw_json)
+    logger.info("⚙️ Rearranging JSON...")
+    cleaned = rearrange(raw_json)
 
-resource_id = cleaned["resourceIdentifier"]
-key_name = f"VCS_{resource_id}"
+    resource_id = cleaned["resourceIdentifier"]
+    key_name = f"VCS_{resource_id}"
 
-print(f"\n🔧 Appending into projects.json as key: {key_name}")
+    logger.info("🔧 Saving into projects/ as key: %s", key_name)
 
-# Load existing list
-projects_file_data = load_projects_file()
+    # Add (or overwrite) this project
+    save_project(key_name, cleaned)
 
-# Append new object
-projects_file_data["projects"].append({key_name: cleaned})
+    logger.info("✅ Saved into projects/%s.json", key_name)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "--- Saved project %s ---\n%s",
+            key_name, orjson.dumps(cleaned, option=orjson.OPT_INDENT_2).decode(),
+        )
 
-# Save back
-save_projects_file(projects_file_data)
 
-print("\n✅ Saved into projects.json")
-print("\n--- Final appended object ---")
-print(json.dumps({key_name: cleaned}, indent=2, ensure_ascii=False))
+if __name__ == "__main__":
+    configure_logging()
+    main()
@@ -1,73 +1,103 @@
 # runner.py  (inside data/ folder)
 
 import asyncio
-import json
+import logging
 from pathlib import Path
 
 # Import functions from the other scripts
-from Scraping import fetch_verra_json, rearrange, load_projects_file, save_projects_file
+from Scraping import fetch_verra_json, rearrange, save_project, project_exists, extract_project_id
 from FilterDocs import filter_latest_tier1_docs, save_to_projectdocs
-from DownloadPdf import download_all_for_project
+from DownloadPdf import download_all_for_project, all_pdfs_downloaded
+from HttpClient import close_client
+from LogSetup import configure_logging
+
+
+logger = logging.getLogger(__name__)
 
 
 # ------------------------
 # MAIN ORCHESTRATION LOGIC
 # ------------------------
 async def run_all(project_url: str):
-    print("\n==============================")
-    print("   SDG DATA PIPELINE START")
-    print("==============================\n")
+    logger.info("==== SDG DATA PIPELINE START: %s ====", project_url)
+
+    # Already scraped and every PDF downloaded → nothing to do
+    known_key = f"VCS_{extract_project_id(project_url)}"
+    if project_exists(known_key) and all_pdfs_downloaded(known_key):
+        logger.info("⏩ %s already scraped and downloaded, skipping.", known_key)
+        return
 
     # -----------------------------
     # 1️⃣ FETCH + REARRANGE JSON
     # -----------------------------
-    print(f"🌐 Fetching JSON for URL:\n{project_url}")
-
     raw_json = await fetch_verra_json(project_url)
 
-    print("⚙️ Rearranging JSON structure...")
-    cleaned = rearrange(raw_json)
+    logger.info("⚙️ Rearranging JSON structure...")
+    # Only Tier-1 docs are ever filtered/downloaded, so don't store the rest
+    cleaned = rearrange(raw_json, tier1_only=True)
 
     rid = cleaned["resourceIdentifier"]
     project_key = f"VCS_{rid}"
 
-    # Save to projects.json
-    print(f"📌 Saving rearranged JSON under key: {project_key}")
-    projects_file_data = load_projects_file()
-    projects_file_data["projects"].append({project_key: cleaned})
-    save_projects_file(projects_file_data)
+    # Save to projects/<project_key>.json
+    logger.info("📌 Saving rearranged JSON under key: %s", project_key)
+    # File writes run in a worker thread so other projects' requests keep flowing
+    await asyncio.to_thread(save_project, project_key, cleaned)
 
     # -----------------------------
     # 2️⃣ FILTER DOCS (Tier-1 only)
     # -----------------------------
-    print("\n🔍 Filtering Tier-1 documents (latest versions)...")
+    logger.info("🔍 Filtering Tier-1 documents (latest versions)...")
 
     docs = cleaned.get("documents", [])
     filtered_docs = filter_latest_tier1_docs(docs)
 
-    print(f"📄 Selected {len(filtered_docs)} Tier-1 docs:")
+    logger.info("📄 Selected %d Tier-1 docs for %s", len(filtered_docs), project_key)
     for d in filtered_docs:
-        print(f" - {d['documentType']} → {d['documentName']}")
+        logger.debug(" - %s → %s", d["documentType"], d["documentName"])
 
-    # Save them into projectdocs.json
-    save_to_projectdocs(project_key, filtered_docs)
+    # Save them into projectdocs/<project_key>.json
+    await asyncio.to_thread(save_to_projectdocs, project_key, filtered_docs)
 
     # -----------------------------
     # 3️⃣ DOWNLOAD PDFs
     # -----------------------------
-    print("\n📥 Starting PDF downloads...")
+    logger.info("📥 Starting PDF downloads for %s...", project_key)
     await download_all_for_project(project_key)
 
-    print("\n==============================")
-    print("      🎉 PIPELINE DONE!")
-    print("==============================\n")
+    logger.info("==== 🎉 PIPELINE DONE: %s ====", project_key)
+
+
+async def run_many(project_urls: list[str]):
+    """
+    Run several projects at once. They all share the one HTTP/2 client, so
+    their API calls and downloads are multiplexed over the same connection.
+    """
+    results = await asyncio.gather(
+        *(run_all(url) for url in project_urls),
+        return_exceptions=True,
+    )
+
+    for url, result in zip(project_urls, results):
+        if isinstance(result, Exception):
+            logger.error("❌ Pipeline failed for %s: %r", url, result)
 
 
 # ------------------------
-# RUN WITH CUSTOM URL
+# RUN WITH CUSTOM URLS
 # ------------------------
 if __name__ == "__main__":
+    configure_logging()
+
     # Change only this:
-    PROJECT_URL = "https://registry.verra.org/app/projectDetail/VCS/4811"
+    PROJECT_URLS = [
+        "https://registry.verra.org/app/projectDetail/VCS/4811",
+    ]
+
+    async def _main():
+        try:
+            await run_many(PROJECT_URLS)
+        finally:
+            await close_client()
 
-    asyncio.run(run_all(PROJECT_URL))
+    asyncio.run(_main())
@@ -1,25 +1,55 @@
-
+import asyncio
 import warnings
 import logging
 
-from cryptography.utils import CryptographyDeprecationWarning
-
-from modules.pdf_extraction import list_projects
-from pipeline.run_pipeline import run_pipeline
-
 # -----------------------------
 # WARNING & LOGGING SETTINGS
+# (before the project imports below, which pull in pdfminer/pdfplumber)
 # -----------------------------
+logging.basicConfig(
+    level=logging.INFO,
+    format="[%(asctime)s] [%(levelname)s] %(name)s - %(message)s",
+)
+
+# Silence pdfminer log spam (those "Cannot set gray non-stroke color..." messages)
+logging.getLogger("pdfminer").setLevel(logging.ERROR)
+logging.getLogger("pdfminer.pdfinterp").setLevel(logging.ERROR)
+
+from cryptography.utils import CryptographyDeprecationWarning
 
 # Hide Cryptography deprecation warning (ARC4 etc.)
 warnings.filterwarnings("ignore", category=CryptographyDeprecationWarning)
 
-# Optionally hide all warnings (you can comment this out if you want some warnings)
-warnings.filterwarnings("ignore")
+from modules.pdf_extraction import list_projects
+from pipeline.run_pipeline import run_pipeline
+
+
+# Projects processed at once (each one mostly waits on LLM calls)
+MAX_CONCURRENT_PROJECTS = 4
+
+
+async def run_one(p: str, sem: asyncio.Semaphore):
+    async with sem:
+        print(f"\n======================")
+        print(f"RUNNING PROJECT {p}")
+        print(f"======================")
+
+        # run_pipeline is blocking; a worker thread keeps the loop free
+        # to start the other projects
+        await asyncio.to_thread(run_pipeline, p)
+
+
+async def run_all(projects: list[str]):
+    sem = asyncio.Semaphore(MAX_CONCURRENT_PROJECTS)
+    results = await asyncio.gather(
+        *(run_one(p, sem) for p in projects),
+        return_exceptions=True,
+    )
+
+    for p, result in zip(projects, results):
+        if isinstance(result, Exception):
+            print(f"[ERROR] Pipeline failed for {p}: {result!r}")
 
-# Silence pdfminer log spam (those "Cannot set gray non-stroke color..." messages)
-logging.getLogger("pdfminer").setLevel(logging.ERROR)
-logging.getLogger("pdfminer.pdfinterp").setLevel(logging.ERROR)
 
 # -----------------------------
 # MAIN LOOP
@@ -27,9 +57,4 @@ logging.getLogger("pdfminer.pdfinterp").setLevel(logging.ERROR)
 if __name__ == "__main__":
     projects = list_projects()
 
-    for p in projects:
-        print(f"\n======================")
-        print(f"RUNNING PROJECT {p}")
-        print(f"======================")
-
-        run_pipeline(p)
+    asyncio.run(run_all(projects))
@@ -2,130 +2,226 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import random
 import re
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import List, Dict, Any, Literal, Optional, get_args
 
 from langchain.chat_models import init_chat_model
 from langchain_core.messages import SystemMessage, HumanMessage
+from pydantic import BaseModel, field_validator
 
-from config.settings import GROQ_MODEL_NAME, logger
+from config.settings import settings, logger
 from modules.scoring import score_factor_with_details
+from modules.llm_cache import cache_key, cache_get, cache_put
 
 
-def _parse_sdg_goal_from_factor(factor: str) -> str:
-    """Extract SDG number from keys like 'SDG_5_Gender_Equality'."""
-    try:
-        return factor.split("_")[1]
-    except Exception:
-        return "0"
+_SDG_GOAL_RE = re.compile(r"SDG_(\d+)")
+
 
+@lru_cache(maxsize=64)
+def _parse_sdg_goal_from_factor(factor: str) -> str:
+    """Extract SDG number from keys like 'SDG_5_Gender_Equality' ("0" if none)."""
+    m = _SDG_GOAL_RE.match(factor)
+    return m.group(1) if m else "0"
 
-def _extract_json(raw_text: str) -> str:
-    """Recover a JSON object even if wrapped with ```json fences or surrounding text."""
-    raw = raw_text.strip()
 
-    # strip ```json fences
-    if raw.startswith("```"):
-        raw = re.sub(r"^```[a-zA-Z]*", "", raw)
-        raw = raw.replace("```", "").strip()
+# Longest evidence sentence sent to the model (OCR run-ons can be thousands of chars)
+MAX_SENTENCE_CHARS = 300
 
-    # already a JSON object
-    if raw.lstrip().startswith("{"):
-        return raw
 
-    # try to grab the first {...} block
-    m = re.search(r"\{.*\}", raw, flags=re.DOTALL)
-    return m.group(0).strip() if m else raw
+def _clip(s: str, limit: int = MAX_SENTENCE_CHARS) -> str:
+    return s if len(s) <= limit else s[:limit].rstrip() + "…"
 
 
 def _snippet(sentences: List[str], max_s: int = 15) -> str:
-    """Numbered snippet of evidence sentences to keep prompts small."""
+    """
+    Numbered snippet of evidence sentences to keep prompts small.
+    Evidence arrives best-match first (factor_matching sorts by similarity),
+    so the first max_s sentences are kept, each clipped to MAX_SENTENCE_CHARS.
+    """
     if not sentences:
         return "No raw evidence sentences were provided."
     take = sentences[:max_s]
-    return "\n".join(f"{i+1}. {s}" for i, s in enumerate(take))
+    return "\n".join(f"{i+1}. {_clip(s)}" for i, s in enumerate(take))
+
+
+# Bump whenever the prompt, the expected JSON shape or the scoring rules change
+# (the cache stores finished, scored assessments, so this invalidates it)
+PROMPT_VERSION = "fused-v3"
+
+# Max LLM requests in flight at once (Groq rate limits apply per key)
+LLM_MAX_CONCURRENCY = 8
+
+# Retries for rate limits (429) and provider 5xx (exponential backoff with jitter)
+LLM_MAX_ATTEMPTS = 4
+LLM_RETRY_BASE_DELAY = 1.0
+LLM_RETRY_MAX_DELAY = 30.0
+
 
+# Shared by every factor: built once, and an identical prefix on every request
+# lets the provider reuse its prompt cache.
+_SYSTEM_MSG = SystemMessage(
+    content=(
+        "You are an expert SDG co-benefit assessor and rating expert. "
+        "You classify evidence, durability and SDG claims, and decide if a "
+        "factor should be excluded from scoring. "
+        "Always respond with valid JSON only, no markdown."
+    )
+)
+
+
+def _messages(user_prompt: str) -> list:
+    return [_SYSTEM_MSG, HumanMessage(content=user_prompt)]
+
+
+LevelOfChange = Literal["predicted_only", "output", "outcome", "impact"]
+EvidenceQuality = Literal["narrated", "estimated", "quantified", "quantified_with_method"]
+SdgClaimType = Literal["explicit", "implicit", "unclear"]
+ExcludedReason = Literal["insufficient_evidence", "rated_under_other_SDG"]
 
-def _as_list(val: Any) -> List[str]:
-    """Normalize optional list fields from the model."""
-    return val if isinstance(val, list) else []
 
+def _canonical(val: Any, allowed: tuple) -> Optional[str]:
+    """Match val to one of allowed, ignoring case and surrounding space (None if no match)."""
+    if isinstance(val, str):
+        key = val.strip().lower()
+        for a in allowed:
+            if a.lower() == key:
+                return a
+    return None
 
-def _call_llm_json(llm, system_msg: str, user_prompt: str) -> Dict[str, Any]:
+
+class FactorAssessment(BaseModel):
     """
-    Generic helper:
-    - Calls the LLM with system + user messages.
-    - Extracts a JSON object from the response.
-    - Returns it as a Python dict, or raises on failure.
+    Validated answer to the fused prompt. Formatting slips are normalized
+    (null lists, enum case/spacing, unknown claim type or excluded reason);
+    only a bad level_of_change, evidence_quality or durability_measures fails.
     """
-    resp = llm.invoke([
-        SystemMessage(content=system_msg),
-        HumanMessage(content=user_prompt),
-    ])
-    raw = getattr(resp, "content", str(resp))
-    raw_json = _extract_json(raw)
-    data = json.loads(raw_json)
-    if not isinstance(data, dict):
-        raise ValueError("LLM did not return a JSON object.")
-    return data
 
+    level_of_change: LevelOfChange
+    level_support_sentences: List[str] = []
+
+    evidence_quality: EvidenceQuality
+    evidence_quality_support_sentences: List[str] = []
+
+    durability_measures: bool
+    durability_support_sentences: List[str] = []
+    durability_reason: Optional[str] = None
 
-# ───────────────────────────── STAGE HELPERS ───────────────────────────── #
+    sdg_claim_type: SdgClaimType = "unclear"
+    sdg_claim_support_sentences: List[str] = []
 
+    excluded_reason: Optional[ExcludedReason] = None
 
-def _stage_level_of_change(llm, factor: str, sentences: List[str]) -> Dict[str, Any]:
+    @field_validator(
+        "level_support_sentences",
+        "evidence_quality_support_sentences",
+        "durability_support_sentences",
+        "sdg_claim_support_sentences",
+        mode="before",
+    )
+    @classmethod
+    def _null_list(cls, v: Any) -> Any:
+        return [] if v is None else v
+
+    @field_validator("level_of_change", mode="before")
+    @classmethod
+    def _level(cls, v: Any) -> Any:
+        # unknown values are passed through so validation still fails
+        return _canonical(v, get_args(LevelOfChange)) or v
+
+    @field_validator("evidence_quality", mode="before")
+    @classmethod
+    def _quality(cls, v: Any) -> Any:
+        return _canonical(v, get_args(EvidenceQuality)) or v
+
+    @field_validator("durability_reason", mode="before")
+    @classmethod
+    def _reason(cls, v: Any) -> Optional[str]:
+        return v if isinstance(v, str) else None
+
+    @field_validator("sdg_claim_type", mode="before")
+    @classmethod
+    def _claim_type(cls, v: Any) -> str:
+        return _canonical(v, get_args(SdgClaimType)) or "unclear"
+
+    @field_validator("excluded_reason", mode="before")
+    @classmethod
+    def _excluded(cls, v: Any) -> Optional[str]:
+        # "none", "null", "" and anything unrecognized mean "not excluded"
+        return _canonical(v, get_args(ExcludedReason))
+
+
+@lru_cache(maxsize=1)
+def _get_llm():
     """
-    Stage 1: Decide the level_of_change and pick support sentences.
+    One chat model for the whole process (reused across projects, so its
+    HTTP connection pool stays warm). JSON mode plus FactorAssessment
+    validation: invoke() returns a FactorAssessment or raises.
     """
-    snippet = _snippet(sentences, max_s=20)
-    system = (
-        "You are an expert SDG co-benefit assessor. "
-        "Always respond with valid JSON only, no markdown."
-    )
-    user = f"""
+    llm = init_chat_model(settings.groq_model_name, model_provider="groq")
+    return llm.with_structured_output(FactorAssessment, method="json_mode")
+
+
+def _retry_delay(exc: Exception, attempt: int) -> float | None:
+    """Seconds to wait before retrying after exc, or None if it is not transient."""
+    status = getattr(exc, "status_code", None)
+    if status != 429 and not (isinstance(status, int) and status >= 500):
+        return None  # parse/validation errors and other 4xx won't fix themselves
+
+    response = getattr(exc, "response", None)
+    retry_after = str(getattr(response, "headers", {}).get("retry-after", ""))
+    if retry_after.isdigit():
+        return min(float(retry_after), LLM_RETRY_MAX_DELAY)
+
+    backoff = min(LLM_RETRY_MAX_DELAY, LLM_RETRY_BASE_DELAY * 2 ** (attempt - 1))
+    return backoff + random.uniform(0, LLM_RETRY_BASE_DELAY)
+
+
+async def _invoke_with_retry(llm, sem: asyncio.Semaphore, messages: list, factor: str):
+    """llm.invoke under the semaphore, backing off on 429/5xx."""
+    for attempt in range(1, LLM_MAX_ATTEMPTS + 1):
+        try:
+            async with sem:
+                # Sync client in a worker thread: unlike the async one, its
+                # pool is not tied to the event loop of a single asyncio.run()
+                return await asyncio.to_thread(llm.invoke, messages)
+        except Exception as e:
+            delay = _retry_delay(e, attempt)
+            if delay is None or attempt == LLM_MAX_ATTEMPTS:
+                raise
+            logger.warning(
+                "[ASSESS] %s: retry %d/%d in %.1fs (%s)",
+                factor, attempt, LLM_MAX_ATTEMPTS - 1, delay, e,
+            )
+            # Sleep outside the semaphore so the slot goes to another factor
+            await asyncio.sleep(delay)
+
+
+# ───────────────────────────── FUSED STAGE ───────────────────────────── #
+
+
+# Fused assessment prompt; filled with .format(factor=..., snippet=...)
+_ASSESS_TMPL = """
 Factor: {factor}
 
 Cleaned evidence sentences (sample):
 {snippet}
 
-CLASSIFY level_of_change for this factor. Use ONLY these values:
+Answer ALL five tasks below for this factor.
+
+1) CLASSIFY level_of_change. Use ONLY these values:
 - "predicted_only"  (only forecasts or models, no observed changes yet)
 - "output"          (immediate deliverables: trainings held, stoves distributed, etc.)
 - "outcome"         (changes in behavior, access, practices, services)
 - "impact"          (changes in well-being, poverty, health, environment at scale)
 
 Choose the level based on the strongest evidence in the sentences.
-
 Also return up to 5 sentences from the evidence that best justify this choice.
 These should be copied exactly from the evidence text.
 
-Return STRICT JSON:
-
-{{
-  "level_of_change": "predicted_only" | "output" | "outcome" | "impact",
-  "level_support_sentences": ["...", "..."]
-}}
-"""
-    return _call_llm_json(llm, system, user)
-
-
-def _stage_evidence_quality(llm, factor: str, sentences: List[str]) -> Dict[str, Any]:
-    """
-    Stage 2: Decide evidence_quality and pick support sentences.
-    """
-    snippet = _snippet(sentences, max_s=20)
-    system = (
-        "You are an expert SDG evidence assessor. "
-        "Always respond with valid JSON only, no markdown."
-    )
-    user = f"""
-Factor: {factor}
-
-Cleaned evidence sentences (sample):
-{snippet}
-
-CLASSIFY evidence_quality for this factor. Use ONLY:
+2) CLASSIFY evidence_quality. Use ONLY:
 - "narrated"
 - "estimated"
 - "quantified"
@@ -138,32 +234,7 @@ Guidance:
 - quantified_with_method: clear numbers AND explicit mention of surveys, sampling methods,
   baselines, control groups, or similar methodological details.
 
-Return STRICT JSON:
-
-{{
-  "evidence_quality": "narrated" | "estimated" | "quantified" | "quantified_with_method",
-  "evidence_quality_support_sentences": ["...", "..."]
-}}
-"""
-    return _call_llm_json(llm, system, user)
-
-
-def _stage_durability(llm, factor: str, sentences: List[str]) -> Dict[str, Any]:
-    """
-    Stage 3: Decide durability_measures, support sentences, and a short reason.
-    """
-    snippet = _snippet(sentences, max_s=20)
-    system = (
-        "You are an expert on durability of development interventions. "
-        "Always respond with valid JSON only, no markdown."
-    )
-    user = f"""
-Factor: {factor}
-
-Cleaned evidence sentences (sample):
-{snippet}
-
-Decide whether this factor has long-term durability measures.
+3) Decide whether this factor has long-term durability measures.
 
 durability_measures = true if there is clear evidence of ANY of:
 - long-term contracts or legal agreements
@@ -173,33 +244,7 @@ durability_measures = true if there is clear evidence of ANY of:
 
 durability_measures = false if you see no convincing long-term mechanism.
 
-Return STRICT JSON:
-
-{{
-  "durability_measures": true or false,
-  "durability_support_sentences": ["...", "..."],
-  "durability_reason": "1-3 sentence explanation of why you chose true/false."
-}}
-"""
-    return _call_llm_json(llm, system, user)
-
-
-def _stage_sdg_claim_type(llm, factor: str, sentences: List[str]) -> Dict[str, Any]:
-    """
-    Stage 4: Decide whether the SDG claim is explicit, implicit, or unclear.
-    """
-    snippet = _snippet(sentences, max_s=30)
-    system = (
-        "You are an SDG claims classifier. "
-        "Always respond with valid JSON only, no markdown."
-    )
-    user = f"""
-Factor: {factor}
-
-Cleaned evidence sentences (sample):
-{snippet}
-
-Classify sdg_claim_type for this factor:
+4) Classify sdg_claim_type:
 
 - "explicit":
     The documentation directly names SDGs or SDG targets, e.g.
@@ -215,52 +260,7 @@ Classify sdg_claim_type for this factor:
 - "unclear":
     Evidence is too weak or ambiguous to tell, or the SDG link is very weak.
 
-Return STRICT JSON:
-
-{{
-  "sdg_claim_type": "explicit" | "implicit" | "unclear",
-  "sdg_claim_support_sentences": ["...", "..."]
-}}
-"""
-    return _call_llm_json(llm, system, user)
-
-
-def _stage_excluded_reason(
-    llm,
-    factor: str,
-    sentences: List[str],
-    level_of_change: str | None,
-    evidence_quality: str | None,
-) -> Dict[str, Any]:
-    """
-    Stage 5 (optional): Suggest excluded_reason, to stay close to original behaviour.
-
-    allowed values:
-      - "insufficient_evidence"
-      - "rated_under_other_SDG"
-      - null
-    """
-    # If there is almost nothing, short-circuit to insufficient_evidence.
-    if not sentences or len(sentences) < 3:
-        return {"excluded_reason": "insufficient_evidence"}
-
-    snippet = _snippet(sentences, max_s=20)
-    system = (
-        "You are an SDG rating expert. "
-        "You decide if a factor should be excluded from scoring. "
-        "Always respond with valid JSON only, no markdown."
-    )
-    user = f"""
-Factor: {factor}
-
-Cleaned evidence sentences (sample):
-{snippet}
-
-Current classification (for context):
-- level_of_change: {level_of_change}
-- evidence_quality: {evidence_quality}
-
-Decide excluded_reason. Use ONLY:
+5) Decide excluded_reason, taking your answers to 1) and 2) into account. Use ONLY:
 - "insufficient_evidence"
 - "rated_under_other_SDG"
 - null   (use JSON null, not a string)
@@ -275,22 +275,161 @@ Guidance:
 Return STRICT JSON:
 
 {{
+  "level_of_change": "predicted_only" | "output" | "outcome" | "impact",
+  "level_support_sentences": ["...", "..."],
+  "evidence_quality": "narrated" | "estimated" | "quantified" | "quantified_with_method",
+  "evidence_quality_support_sentences": ["...", "..."],
+  "durability_measures": true or false,
+  "durability_support_sentences": ["...", "..."],
+  "durability_reason": "1-3 sentence explanation of why you chose true/false.",
+  "sdg_claim_type": "explicit" | "implicit" | "unclear",
+  "sdg_claim_support_sentences": ["...", "..."],
   "excluded_reason": "insufficient_evidence" | "rated_under_other_SDG" | null
 }}
 """
-    return _call_llm_json(llm, system, user)
+
+
+def _stage_all(factor: str, snippet: str) -> str:
+    """
+    Single prompt covering all five rubrics (level_of_change, evidence_quality,
+    durability, sdg_claim_type, excluded_reason) so each factor costs one LLM call.
+    snippet is the pre-formatted _snippet() of the evidence.
+    """
+    return _ASSESS_TMPL.format(factor=factor, snippet=snippet)
+
+
+# ─────────────────────────── RESULT BUILDERS ─────────────────────────── #
+
+
+def _empty_fallback(factor: str) -> Dict[str, Any]:
+    """Conservative fallback for too little evidence or when the LLM or parsing fails."""
+    return {
+        "factor": factor,
+        "sdg_goal": _parse_sdg_goal_from_factor(factor),
+
+        "level_of_change": "predicted_only",
+        "evidence_quality": "narrated",
+        "durability_measures": False,
+        "excluded_reason": "insufficient_evidence",
+
+        "sdg_claim_type": "unclear",
+
+
+        "durability_reason": "Fallback: insufficient evidence or model failure.",
+
+        "level_support_sentences": [],
+        "evidence_quality_support_sentences": [],
+        "durability_support_sentences": [],
+        "sdg_claim_support_sentences": [],
+
+        "score": 0,
+        "score_details": {
+            "score": 0,
+            "level_base": 0,
+            "evidence_weight": 0.0,
+            "durability_bonus": 0,
+            "raw_score": 0.0,
+            "excluded_by_reason": "insufficient_evidence",
+        },
+    }
+
+
+def _build_assessment(factor: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn a validated FactorAssessment dump into one scored assessment."""
+    # ── Build assessment object ──
+    assessment: Dict[str, Any] = {
+        "factor": factor,
+        "sdg_goal": _parse_sdg_goal_from_factor(factor),
+
+        "level_of_change": data["level_of_change"],
+        "evidence_quality": data["evidence_quality"],
+        "durability_measures": data["durability_measures"],
+        "excluded_reason": data["excluded_reason"],
+
+        "sdg_claim_type": data["sdg_claim_type"],
+
+        # For UI & traceability
+        "durability_reason": data["durability_reason"],
+
+        "level_support_sentences": data["level_support_sentences"],
+        "evidence_quality_support_sentences": data["evidence_quality_support_sentences"],
+        "durability_support_sentences": data["durability_support_sentences"],
+        "sdg_claim_support_sentences": data["sdg_claim_support_sentences"],
+    }
+
+    # ── Score calculation + breakdown ──
+    details = score_factor_with_details(assessment)
+    assessment["score"] = details["score"]
+    assessment["score_details"] = details
+    return assessment
 
 
 # ─────────────────────────── MAIN ENTRYPOINT ─────────────────────────── #
 
 
+async def _assess_one(
+    llm,
+    sem: asyncio.Semaphore,
+    factor: str,
+    ev: List[str],
+    use_cache: bool = True,
+) -> Dict[str, Any]:
+    """Assess one factor; never raises (falls back instead)."""
+    logger.info("[ASSESS] Assessing %s", factor)
+
+    # If there is almost nothing, skip the LLM entirely.
+    if len(ev) < 3:
+        logger.info("[ASSESS] %s: only %d sentences, insufficient evidence", factor, len(ev))
+        return _empty_fallback(factor)
+
+    try:
+        # The model only ever sees the snippet, so it is also the cache key
+        snippet = _snippet(ev, max_s=30)
+        key = cache_key(settings.groq_model_name, PROMPT_VERSION, factor, snippet)
+        if use_cache:
+            cached = cache_get(key)
+            if cached is not None:
+                logger.info("[ASSESS] Cache hit for %s", factor)
+                return cached
+
+        resp = await _invoke_with_retry(llm, sem, _messages(_stage_all(factor, snippet)), factor)
+        assessment = _build_assessment(factor, resp.model_dump())
+    except Exception as e:
+        logger.warning("[ASSESS] ERROR for %s: %s", factor, e)
+        return _empty_fallback(factor)
+
+    # A failed cache write must not throw away a finished assessment
+    try:
+        cache_put(key, assessment)
+    except Exception as e:
+        logger.warning("[ASSESS] Could not cache %s: %s", factor, e)
+    return assessment
+
+
+async def assess_factors_async(
+    evidence_map: Dict[str, List[str]],
+    use_cache: bool = True,
+) -> List[Dict[str, Any]]:
+    """
+    Async version of assess_factors_from_refined(): every factor is assessed
+    concurrently (at most LLM_MAX_CONCURRENCY requests in flight).
+    """
+    llm = _get_llm()
+    sem = asyncio.Semaphore(LLM_MAX_CONCURRENCY)
+
+    return await asyncio.gather(
+        *(_assess_one(llm, sem, factor, ev, use_cache) for factor, ev in evidence_map.items())
+    )
+
+
 def assess_factors_from_refined(
     evidence_map: Dict[str, List[str]],
+    use_cache: bool = True,
 ) -> List[Dict[str, Any]]:
     """
     evidence_map: { factor_name: [cleaned_sentence1, cleaned_sentence2, ...] }
 
-    For each factor, run multiple LLM stages to derive:
+    For each factor, one fused LLM prompt derives:
 
       - sdg_goal (parsed from factor name)
       - level_of_change
@@ -301,109 +440,10 @@ def assess_factors_from_refined(
 
     Plus support sentences & durability_reason for UI/traceability, and
     a numeric score with breakdown via score_factor_with_details().
-    """
-
-    llm = init_chat_model(GROQ_MODEL_NAME, model_provider="groq")
-    results: List[Dict[str, Any]] = []
 
-    for factor, raw_evidence in evidence_map.items():
-        logger.info(f"[ASSESS] Assessing {factor}")
+    Finished assessments are cached on disk (see modules/llm_cache.py);
+    use_cache=False forces fresh LLM calls (results are still written back).
 
-        try:
-            # ── Stage 1: level_of_change ──
-            lvl_data = _stage_level_of_change(llm, factor, raw_evidence)
-            level_of_change = lvl_data.get("level_of_change")
-            lvl_sup = _as_list(lvl_data.get("level_support_sentences") or [])
-
-            # ── Stage 2: evidence_quality ──
-            eq_data = _stage_evidence_quality(llm, factor, raw_evidence)
-            evidence_quality = eq_data.get("evidence_quality")
-            eq_sup = _as_list(eq_data.get("evidence_quality_support_sentences") or [])
-
-            # ── Stage 3: durability ──
-            dur_data = _stage_durability(llm, factor, raw_evidence)
-            durability_measures = dur_data.get("durability_measures")
-            dur_sup = _as_list(dur_data.get("durability_support_sentences") or [])
-            dur_reason = dur_data.get("durability_reason")
-            if not isinstance(dur_reason, str):
-                dur_reason = None
-
-            # ── Stage 4: sdg_claim_type ──
-            claim_data = _stage_sdg_claim_type(llm, factor, raw_evidence)
-            sdg_claim_type = claim_data.get("sdg_claim_type")
-            if sdg_claim_type not in ("explicit", "implicit", "unclear"):
-                sdg_claim_type = "unclear"
-            claim_sup = _as_list(claim_data.get("sdg_claim_support_sentences") or [])
-
-            # ── Stage 5: excluded_reason ──
-            excl_data = _stage_excluded_reason(
-                llm, factor, raw_evidence, level_of_change, evidence_quality
-            )
-            excluded_reason = excl_data.get("excluded_reason")
-            # Normalize excluded_reason
-            if excluded_reason not in ("insufficient_evidence", "rated_under_other_SDG"):
-                excluded_reason = None
-
-            # ── Build assessment object ──
-            assessment: Dict[str, Any] = {
-                "factor": factor,
-                "sdg_goal": _parse_sdg_goal_from_factor(factor),
-
-                "level_of_change": level_of_change,
-                "evidence_quality": evidence_quality,
-                "durability_measures": durability_measures,
-                "excluded_reason": excluded_reason,
-
-                "sdg_claim_type": sdg_claim_type,
-
-                # For UI & traceability
-                "durability_reason": dur_reason,
-
-                "level_support_sentences": lvl_sup,
-                "evidence_quality_support_sentences": eq_sup,
-                "durability_support_sentences": dur_sup,
-                "sdg_claim_support_sentences": claim_sup,
-            }
-
-            # ── Score calculation + breakdown ──
-            details = score_factor_with_details(assessment)
-            assessment["score"] = details["score"]
-            assessment["score_details"] = details
-
-            results.append(assessment)
-
-        except Exception as e:
-            logger.warning(f"[ASSESS] ERROR for {factor}: {e}")
-
-            # Conservative fallback when the LLM or parsing fails
-            results.append({
-                "factor": factor,
-                "sdg_goal": _parse_sdg_goal_from_factor(factor),
-
-                "level_of_change": "predicted_only",
-                "evidence_quality": "narrated",
-                "durability_measures": False,
-                "excluded_reason": "insufficient_evidence",
-
-                "sdg_claim_type": "unclear",
-
-                
-                "durability_reason": "Fallback: insufficient evidence or model failure.",
-
-                "level_support_sentences": [],
-                "evidence_quality_support_sentences": [],
-                "durability_support_sentences": [],
-                "sdg_claim_support_sentences": [],
-
-                "score": 0,
-                "score_details": {
-                    "score": 0,
-                    "level_base": 0,
-                    "evidence_weight": 0.0,
-                    "durability_bonus": 0,
-                    "raw_score": 0.0,
-                    "excluded_by_reason": "insufficient_evidence",
-                },
-            })
-
-    return results
+    Sync wrapper around assess_factors_async() for the (sync) pipeline.
+    """
+    return asyncio.run(assess_factors_async(evidence_map, use_cache))
@@ -4,10 +4,26 @@ import re
 from typing import List, Optional
 
 import spacy
-from config.settings import SPACY_MODEL
+from config.settings import settings
 
-# Load spaCy model once at import time
-nlp = spacy.load(SPACY_MODEL)
+# Load spaCy model once at import time. Only sentence boundaries are used.
+# Models with a senter (en_core_web_sm/md/lg) load just the tokenizer and the
+# senter, which carries its own embedding layer: the shared tok2vec, tagger,
+# parser, ner, lemmatizer and attribute_ruler are excluded (never loaded or
+# run). Models without a senter keep the parser for sentence splitting.
+_SENTER_EXCLUDE = ["tok2vec", "tagger", "parser", "ner", "lemmatizer", "attribute_ruler"]
+_PARSER_DISABLE = ["tagger", "ner", "lemmatizer", "attribute_ruler"]
+
+
+def _load_sentence_nlp(model_name: str):
+    nlp = spacy.load(model_name, exclude=_SENTER_EXCLUDE)
+    if "senter" in nlp.component_names:
+        nlp.enable_pipe("senter")
+        return nlp
+    return spacy.load(model_name, disable=_PARSER_DISABLE)
+
+
+nlp = _load_sentence_nlp(settings.spacy_model)
 nlp.max_length = 5_000_000
 
 TABLE_HEADING_RE = re.compile(r"^(Table|Annex|Illustration)\s+\d+", re.IGNORECASE)
@@ -21,8 +37,22 @@ def split_into_sentences(text: str) -> List[str]:
     Use spaCy to split a large text into sentences.
     Much better than text.split(".") – handles abbreviations, etc.
     """
-    doc = nlp(text)
-    return [sent.text.strip() for sent in doc.sents if sent.text.strip()]
+    return _doc_sentences(nlp(text))
+
+
+def split_many(texts: List[str], batch_size: int = 8, n_process: int = 1) -> List[List[str]]:
+    """
+    Batch version of split_into_sentences: one sentence list per input text,
+    in input order. Texts are streamed through nlp.pipe.
+    """
+    return [
+        _doc_sentences(doc)
+        for doc in nlp.pipe(texts, batch_size=batch_size, n_process=n_process)
+    ]
+
+
+def _doc_sentences(doc) -> List[str]:
+    return [s for s in (sent.text.strip() for sent in doc.sents) if s]
 
 
 def clean_sentence(sentence: str) -> Optional[str]:
@@ -61,11 +91,14 @@ def clean_sentence(sentence: str) -> Optional[str]:
         if NUMERIC_ONLY_RE.fullmatch(l):
             continue
 
+        # split once: used for the heading check and whitespace normalization
+        words = l.split()
+
         # skip all-caps short headings
-        if ALL_CAPS_HEADING_RE.match(l) and len(l.split()) <= 8:
+        if ALL_CAPS_HEADING_RE.match(l) and len(words) <= 8:
             continue
 
-        cleaned_lines.append(" ".join(l.split()))
+        cleaned_lines.append(" ".join(words))
 
     if not cleaned_lines:
         return None
@@ -0,0 +1,94 @@
+# modules/embedding_cache.py
+
+from typing import List, Optional
+import hashlib
+import os
+import pickle
+import threading
+
+import numpy as np
+
+from config.settings import settings, logger
+
+
+EMB_CACHE_DIR = settings.cache_dir / "embeddings"
+
+
+def text_key(text: str) -> bytes:
+    """First 16 bytes of sha256 over the (already normalized) text."""
+    return hashlib.sha256(text.encode("utf-8")).digest()[:16]
+
+
+class EmbeddingCache:
+    """
+    Append-only on-disk store of float16 embedding rows for one model.
+
+    - vectors.f16: raw rows, shape (n, dim), read through np.memmap
+    - index.pkl:   {text_key -> row}, loaded once, rewritten after each add
+
+    Rows are written before the index is replaced, so a crash can only leave
+    unindexed rows (or a torn last row, cut off on the next open) behind.
+
+    Only ONE process may use a cache directory at a time: access is guarded by
+    a threading.Lock, which is enough for main.py (projects run in threads of
+    one process), but appends and index rewrites are not coordinated across
+    processes.
+    """
+
+    def __init__(self, model_name: str, dim: int):
+        self.dim = dim
+        self.dir = EMB_CACHE_DIR / model_name.replace("/", "__")
+        self.dir.mkdir(parents=True, exist_ok=True)
+        self.vec_path = self.dir / "vectors.f16"
+        self.idx_path = self.dir / "index.pkl"
+        self._lock = threading.Lock()
+        self._mm: Optional[np.memmap] = None
+
+        # float16 rows; cut off a partial row left by an interrupted write so
+        # every row starts at rows * row_bytes
+        self.row_bytes = 2 * dim
+        self.vec_path.touch(exist_ok=True)
+        size = self.vec_path.stat().st_size
+        self.rows = size // self.row_bytes
+        if size != self.rows * self.row_bytes:
+            logger.warning("[EMB-CACHE] Truncating torn row in %s", self.vec_path)
+            os.truncate(self.vec_path, self.rows * self.row_bytes)
+
+        self.index = {}
+        if self.idx_path.exists():
+            try:
+                with open(self.idx_path, "rb") as f:
+                    self.index = pickle.load(f)
+            except Exception as e:
+                logger.warning("[EMB-CACHE] Ignoring unreadable index %s: %s", self.idx_path, e)
+        # drop entries pointing past the end of the vector file
+        self.index = {k: r for k, r in self.index.items() if r < self.rows}
+        logger.info("[EMB-CACHE] %d cached embeddings in %s", len(self.index), self.dir)
+
+    def lookup(self, keys: List[bytes]) -> List[Optional[int]]:
+        with self._lock:
+            return [self.index.get(k) for k in keys]
+
+    def read(self, rows: List[int]) -> np.ndarray:
+        with self._lock:
+            if self._mm is None or self._mm.shape[0] < self.rows:
+                self._mm = np.memmap(self.vec_path, dtype=np.float16, mode="r", shape=(self.rows, self.dim))
+            return np.asarray(self._mm[rows], dtype=np.float32)
+
+    def add(self, keys: List[bytes], vecs: np.ndarray) -> None:
+        with self._lock:
+            new = [(k, v) for k, v in zip(keys, vecs) if k not in self.index]
+            if not new:
+                return
+            block = np.stack([v for _, v in new]).astype(np.float16)
+            with open(self.vec_path, "r+b") as f:
+                f.seek(self.rows * self.row_bytes)
+                f.write(block.tobytes())
+            for k, _ in new:
+                self.index[k] = self.rows
+                self.rows += 1
+
+            tmp = self.idx_path.with_name(f"{self.idx_path.name}.{os.getpid()}.tmp")
+            with open(tmp, "wb") as f:
+                pickle.dump(self.index, f, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp.replace(self.idx_path)
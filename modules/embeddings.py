@@ -6,7 +6,8 @@ import numpy as np
 import torch
 from typing import List, Sequence
 from sentence_transformers import SentenceTransformer
-from config.settings import EMBEDDING_MODEL_NAME, logger
+from config.settings import settings, logger
+from modules.embedding_cache import EmbeddingCache, text_key
 import unicodedata
 from tqdm import tqdm   # <-- added
 
@@ -16,7 +17,7 @@ from tqdm import tqdm   # <-- added
 # --------------------------------------
 
 device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
-logger.info(f"[EMB] Using device: {device}")
+logger.info("[EMB] Using device: %s", device)
 
 use_fp16 = torch.cuda.is_available()
 
@@ -29,7 +30,7 @@ use_fp16 = torch.cuda.is_available()
 # LOAD MODEL
 # --------------------------------------
 model = SentenceTransformer(
-    EMBEDDING_MODEL_NAME,
+    settings.embedding_model_name,
     device=device
 )
 logger.info("[EMB] MiniLM model loaded successfully (CPU).")
@@ -43,6 +44,12 @@ model = model.to("cpu")   # Explicit CPU load
 model.eval()
 logger.info("[EMB] Model loaded successfully .")
 
+# Persistent float16 cache of embeddings, keyed on the normalized text
+_cache = EmbeddingCache(
+    settings.embedding_model_name,
+    model.get_sentence_embedding_dimension(),
+)
+
 
 # --------------------------------------
 # NORMALIZATION HELPERS
@@ -65,7 +72,13 @@ def embed(
     batch_size: int = 8,
     normalize: bool = True,
     max_length: int = 256,
+    use_cache: bool = True,
 ) -> np.ndarray:
+    """
+    Embed texts (L2-normalized rows, caller order).
+    Already-seen texts are read from the on-disk cache; only misses go
+    through the model. use_cache=False skips the cache entirely.
+    """
 
     if isinstance(texts, str):
         texts = [texts]
@@ -90,21 +103,43 @@ def embed(
 
         processed.append(t)
 
+    if not use_cache:
+        return _encode(processed, batch_size)
+
+    keys = [text_key(t) for t in processed]
+    rows = _cache.lookup(keys)
+
+    # encode each missing text once, even if repeated in this call
+    misses = {keys[i]: processed[i] for i, r in enumerate(rows) if r is None}
+    if misses:
+        logger.info("[EMB] Cache: %d hits, %d to encode", len(texts) - sum(r is None for r in rows), len(misses))
+        _cache.add(list(misses), _encode(list(misses.values()), batch_size))
+        rows = _cache.lookup(keys)
+
+    return _cache.read(rows)
+
+
+def _encode(processed: List[str], batch_size: int) -> np.ndarray:
+    # Bucket by length so each batch pads to similar-sized inputs;
+    # rows are put back in caller order at the end.
+    order = np.argsort([len(t) for t in processed], kind="stable")
+    sorted_texts = [processed[i] for i in order]
+
     all_embs = []
 
     # Disable autograd
-    with torch.no_grad():
+    with torch.inference_mode():
 
         # tqdm progress bar
-        total_batches = range(0, len(processed), batch_size)
+        total_batches = range(0, len(sorted_texts), batch_size)
         for start in tqdm(
             total_batches,
             desc=f"Embedding batches (bs={batch_size}, device=cpu)",
             ncols=100
         ):
-            batch = processed[start:start + batch_size]
+            batch = sorted_texts[start:start + batch_size]
 
-            # Jina model encode
+            # Jina model encode (already float32 numpy)
             batch_emb = model.encode(
                 batch,
                 batch_size=len(batch),
@@ -113,14 +148,10 @@ def embed(
                 normalize_embeddings=True
             )
 
-
-            # Convert to numpy
-            batch_emb = np.asarray(batch_emb, dtype=np.float32)
-
             all_embs.append(batch_emb)
 
-    # Stack results
-    if len(all_embs) == 1:
-        return all_embs[0]
-
-    return np.vstack(all_embs)
+    # Stack results and undo the length sort
+    stacked = all_embs[0] if len(all_embs) == 1 else np.vstack(all_embs)
+    out = np.empty_like(stacked)
+    out[order] = stacked
+    return out
@@ -1,31 +1,41 @@
 # modules/evidence_refiner.py
 
+from functools import lru_cache
 from typing import Dict, List
-import json
-import re
 
 from langchain.chat_models import init_chat_model
 from langchain_core.messages import SystemMessage, HumanMessage
 
-from config.settings import GROQ_MODEL_NAME, logger
+from config.settings import settings, logger
+from modules.llm_json import extract_json
 
 
-def _extract_json_block(raw: str) -> str:
-    """Recover a JSON object even if wrapped with ``` fences or extra text."""
-    raw = raw.strip()
-
-    # strip ```json fences if present
-    if raw.startswith("```"):
-        raw = re.sub(r"^```[a-zA-Z]*", "", raw)
-        raw = raw.replace("```", "").strip()
+# System prompts are constant: build the messages once and reuse them
+_SYS_LINES = SystemMessage(
+    content=(
+        "You rewrite sentences cleanly without changing their factual content. "
+        "Return ONLY the cleaned sentences, one per line, no extra text."
+    )
+)
+_SYS_SINGLE = SystemMessage(
+    content=(
+        "You rewrite sentences cleanly without changing their factual content. "
+        "Return ONLY the cleaned sentence."
+    )
+)
+_SYS_JSON = SystemMessage(
+    content=(
+        "You rewrite sentences cleanly without changing their factual content. "
+        "Return ONLY valid JSON in the requested format."
+    )
+)
+_SYS_TABLE = SystemMessage(content="Clean table-derived evidence. Output STRICT JSON.")
 
-    # if it already starts with {, use as is
-    if raw.lstrip().startswith("{"):
-        return raw
 
-    # otherwise, try to grab the first {...} block
-    m = re.search(r"\{.*\}", raw, flags=re.DOTALL)
-    return m.group(0).strip() if m else raw
+@lru_cache(maxsize=1)
+def _get_llm():
+    """One chat model for the whole process (reused across projects)."""
+    return init_chat_model(settings.groq_model_name, model_provider="groq", temperature=0.2)
 
 
 def _chunk_sentences(sentences: List[str], max_per_chunk: int = 25) -> List[List[str]]:
@@ -61,12 +71,7 @@ def _fallback_refine_chunk(llm, chunk: List[str]) -> List[str]:
     )
 
     resp = llm.invoke([
-        SystemMessage(
-            content=(
-                "You rewrite sentences cleanly without changing their factual content. "
-                "Return ONLY the cleaned sentences, one per line, no extra text."
-            )
-        ),
+        _SYS_LINES,
         HumanMessage(content=prompt),
     ])
 
@@ -79,15 +84,16 @@ def _fallback_refine_chunk(llm, chunk: List[str]) -> List[str]:
     # If the model produced too many lines, keep the first N.
     if len(lines) > len(chunk):
         logger.warning(
-            f"[REFINE] Fallback cleaner returned {len(lines)} lines for "
-            f"{len(chunk)} sentences. Truncating to {len(chunk)}."
+            "[REFINE] Fallback cleaner returned %d lines for %d sentences. Truncating to %d.",
+            len(lines), len(chunk), len(chunk),
         )
         return lines[:len(chunk)]
 
     # If it produced fewer lines, do a per-sentence micro-fallback.
     logger.warning(
-        f"[REFINE] Fallback cleaner returned {len(lines)} lines for "
-        f"{len(chunk)} sentences. Falling back to per-sentence cleaning."
+        "[REFINE] Fallback cleaner returned %d lines for %d sentences. "
+        "Falling back to per-sentence cleaning.",
+        len(lines), len(chunk),
     )
 
     cleaned: List[str] = []
@@ -102,12 +108,7 @@ def _fallback_refine_chunk(llm, chunk: List[str]) -> List[str]:
         )
 
         single_resp = llm.invoke([
-            SystemMessage(
-                content=(
-                    "You rewrite sentences cleanly without changing their factual content. "
-                    "Return ONLY the cleaned sentence."
-                )
-            ),
+            _SYS_SINGLE,
             HumanMessage(content=single_prompt),
         ])
 
@@ -136,7 +137,7 @@ def refine_evidence(evidence_map: Dict[str, List[str]]) -> Dict[str, List[str]]:
     We never silently skip Groq; each sentence passes through the model at least once.
     """
 
-    llm = init_chat_model(GROQ_MODEL_NAME, model_provider="groq", temperature=0.2)
+    llm = _get_llm()
     refined: Dict[str, List[str]] = {}
 
     for factor, sentences in evidence_map.items():
@@ -145,8 +146,8 @@ def refine_evidence(evidence_map: Dict[str, List[str]]) -> Dict[str, List[str]]:
         sentences = sentences[:100]
 
         logger.info(
-            f"[REFINE] Refining evidence for {factor} "
-            f"using {len(sentences)} of {original_count} sentences (cap=50)"
+            "[REFINE] Refining evidence for %s using %d of %d sentences (cap=50)",
+            factor, len(sentences), original_count,
         )
 
         if not sentences:
@@ -173,20 +174,14 @@ def refine_evidence(evidence_map: Dict[str, List[str]]) -> Dict[str, List[str]]:
             )
 
             resp = llm.invoke([
-                SystemMessage(
-                    content=(
-                        "You rewrite sentences cleanly without changing their factual content. "
-                        "Return ONLY valid JSON in the requested format."
-                    )
-                ),
+                _SYS_JSON,
                 HumanMessage(content=prompt),
             ])
 
-            raw = getattr(resp, "content", str(resp)).strip()
-            raw_json = _extract_json_block(raw)
+            raw = getattr(resp, "content", str(resp))
 
             try:
-                data = json.loads(raw_json)
+                data = extract_json(raw, expected_keys=("cleaned",))
                 cleaned_list = data.get("cleaned") or []
                 if not isinstance(cleaned_list, list) or len(cleaned_list) != len(chunk):
                     raise ValueError(
@@ -195,8 +190,9 @@ def refine_evidence(evidence_map: Dict[str, List[str]]) -> Dict[str, List[str]]:
                     )
             except Exception as e:
                 logger.warning(
-                    f"[REFINE] JSON parse or structure failed for factor {factor}: {e}. "
-                    f"Falling back to line-by-line cleaner."
+                    "[REFINE] JSON parse or structure failed for factor %s: %s. "
+                    "Falling back to line-by-line cleaner.",
+                    factor, e,
                 )
                 cleaned_list = _fallback_refine_chunk(llm, chunk)
 
@@ -214,7 +210,7 @@ def refine_table_evidence(table_map: Dict[str, List[str]]) -> Dict[str, List[str
     - Keep only meaningful content
     - Return JSON { cleaned: [...] }
     """
-    llm = init_chat_model(GROQ_MODEL_NAME, model_provider="groq", temperature=0.2)
+    llm = _get_llm()
     refined_tables = {}
 
     for factor, rows in table_map.items():
@@ -242,13 +238,12 @@ def refine_table_evidence(table_map: Dict[str, List[str]]) -> Dict[str, List[str
             )
 
             resp = llm.invoke([
-                SystemMessage(content="Clean table-derived evidence. Output STRICT JSON."),
+                _SYS_TABLE,
                 HumanMessage(content=prompt),
             ])
 
-            raw_json = _extract_json_block(getattr(resp, "content", str(resp)))
             try:
-                data = json.loads(raw_json)
+                data = extract_json(getattr(resp, "content", str(resp)), expected_keys=("cleaned",))
                 cleaned_list = data.get("cleaned", [])
             except:
                 cleaned_list = chunk  # fallback: keep original
@@ -6,7 +6,7 @@ from typing import List, Dict, Sequence, Optional, Tuple
 import numpy as np
 
 from config.factor_queries import factor_queries
-from config.settings import SIMILARITY_THRESHOLD, logger
+from config.settings import settings, logger
 from modules.embeddings import embed
 
 # -----------------------------------------
@@ -21,8 +21,8 @@ for factor, data in factor_queries.items():
         FACTOR_LABELS.append(factor)
 
 logger.info(
-    f"[MATCH] Prepared {len(FACTOR_SENTENCES)} factor prototype sentences "
-    f"for {len(set(FACTOR_LABELS))} SDG factors."
+    "[MATCH] Prepared %d factor prototype sentences for %d SDG factors.",
+    len(FACTOR_SENTENCES), len(set(FACTOR_LABELS)),
 )
 
 FACTOR_EMB: np.ndarray = embed(FACTOR_SENTENCES)
@@ -47,7 +47,7 @@ def match_factors(
             - 1  => behaves like your original code (one best factor)
             - >1 => sentence can contribute to multiple SDGs if similarity is high
         min_similarity:
-            Override global SIMILARITY_THRESHOLD if given.
+            Override settings.similarity_threshold if given.
 
     Returns:
         Dict[str, List[str]]:
@@ -58,7 +58,7 @@ def match_factors(
           (most similar / strongest evidence first).
     """
 
-    min_sim = float(min_similarity)
+    min_sim = settings.similarity_threshold if min_similarity is None else float(min_similarity)
 
     if not sentences:
         logger.warning("[MATCH] No sentences passed into match_factors().")
@@ -118,9 +118,9 @@ def match_factors(
         results[factor] = [s for score, s in items]
 
     logger.info(
-        f"[MATCH] Processed {len(sentences)} sentences → "
-        f"{num_assigned} sentences assigned to {len(results)} factors "
-        f"(top_k={top_k}, min_sim={min_sim})."
+        "[MATCH] Processed %d sentences → %d sentences assigned to %d factors "
+        "(top_k=%s, min_sim=%s).",
+        len(sentences), num_assigned, len(results), top_k, min_sim,
     )
 
     return results
@@ -0,0 +1,46 @@
+# modules/llm_cache.py
+
+from typing import Any, Dict, Optional
+from pathlib import Path
+import hashlib
+import os
+import tempfile
+
+import orjson
+
+from config.settings import settings, logger
+
+
+LLM_CACHE_DIR = settings.cache_dir / "llm"
+
+
+def cache_key(*parts: str) -> str:
+    """sha256 over the NUL-joined parts (model, prompt version, inputs...)."""
+    return hashlib.sha256("\x00".join(parts).encode("utf-8")).hexdigest()
+
+
+def cache_get(key: str) -> Optional[Dict[str, Any]]:
+    """Return the cached result for key, or None on a miss."""
+    path = LLM_CACHE_DIR / f"{key}.json"
+    try:
+        return orjson.loads(path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except orjson.JSONDecodeError:
+        logger.warning("[CACHE] Ignoring corrupt cache entry %s", path.name)
+        return None
+
+
+def cache_put(key: str, data: Dict[str, Any]) -> None:
+    """Store a JSON-serializable result (written to a temp file, then renamed)."""
+    LLM_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    path = LLM_CACHE_DIR / f"{key}.json"
+    # unique per writer: threads of one process may store the same key at once
+    fd, tmp = tempfile.mkstemp(dir=LLM_CACHE_DIR, prefix=f"{key}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(orjson.dumps(data))
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
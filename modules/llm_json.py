@@ -0,0 +1,64 @@
+# modules/llm_json.py
+
+from typing import Any, Dict, Iterable
+import json
+import re
+
+import orjson
+
+
+_FENCE_RE = re.compile(r"^```[a-zA-Z]*")
+_DECODER = json.JSONDecoder()
+
+
+def extract_json(raw_text: str, expected_keys: Iterable[str] = ()) -> Dict[str, Any]:
+    """
+    Recover a JSON object from an LLM reply, even if wrapped with ```json fences
+    or surrounding text.
+
+    The whole reply is parsed first; if that fails, every `{` is tried as the
+    start of an object with JSONDecoder.raw_decode. When several objects parse,
+    the one holding the most `expected_keys` wins (first one on ties).
+    Raises ValueError if no JSON object can be found.
+    """
+    raw = raw_text.strip()
+
+    # strip ```json fences
+    if raw.startswith("```"):
+        raw = _FENCE_RE.sub("", raw)
+        raw = raw.replace("```", "").strip()
+
+    # plain JSON object (the usual case)
+    try:
+        obj = loads_json(raw)
+        if isinstance(obj, dict):
+            return obj
+    except ValueError:
+        pass
+
+    expected = tuple(expected_keys)
+    candidates = []
+    idx = raw.find("{")
+    while idx != -1:
+        try:
+            obj, end = _DECODER.raw_decode(raw, idx)
+        except ValueError:
+            idx = raw.find("{", idx + 1)
+            continue
+        if isinstance(obj, dict):
+            if not expected:
+                return obj
+            candidates.append(obj)
+        idx = raw.find("{", end)
+
+    if not candidates:
+        raise ValueError("no JSON object found in LLM output")
+    return max(candidates, key=lambda o: sum(k in o for k in expected))
+
+
+def loads_json(raw_json: str) -> Any:
+    """Parse with orjson; fall back to the stdlib for the few inputs it rejects."""
+    try:
+        return orjson.loads(raw_json)
+    except orjson.JSONDecodeError:
+        return json.loads(raw_json)
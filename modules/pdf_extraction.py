@@ -1,31 +1,32 @@
 import os
 from pdfminer.high_level import extract_text
-from config.settings import PROJECTS_ROOT
+from config.settings import settings
 
 def list_projects():
-    """Return a list of project folder names inside PROJECTS_ROOT."""
-    return [
-        d for d in os.listdir(PROJECTS_ROOT)
-        if os.path.isdir(os.path.join(PROJECTS_ROOT, d))
-    ]
+    """Return a list of project folder names inside settings.projects_root."""
+    with os.scandir(settings.projects_root) as it:
+        return [e.name for e in it if e.is_dir()]
 
 def load_pdfs(project_name: str):
     """
     Load all PDFs for a single project.
-    project_name: folder name inside PROJECTS_ROOT.
+    project_name: folder name inside settings.projects_root.
     Returns: list of { 'filename': str, 'text': str }
     """
-    project_path = os.path.join(PROJECTS_ROOT, project_name)
+    project_path = os.path.join(settings.projects_root, project_name)
     pdfs = []
 
-    for f in os.listdir(project_path):
-        if f.lower().endswith(".pdf"):
-            path = os.path.join(project_path, f)
-            try:
-                text = extract_text(path)
-                pdfs.append({"filename": f,"path": path, "text": text})
-            except Exception as e:
-                print(f"[ERROR] Failed to read {path}: {e}")
+    with os.scandir(project_path) as it:
+        entries = [e for e in it if e.name.lower().endswith(".pdf") and e.is_file()]
+
+    for entry in entries:
+        f = entry.name
+        path = entry.path
+        try:
+            text = extract_text(path)
+            pdfs.append({"filename": f,"path": path, "text": text})
+        except Exception as e:
+            print(f"[ERROR] Failed to read {path}: {e}")
 
     print(f"[INFO] Loaded {len(pdfs)} PDFs for project '{project_name}'.")
     return pdfs
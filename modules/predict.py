@@ -1,6 +1,7 @@
+from functools import lru_cache
 from pathlib import Path
 import numpy as np
-import json
+import orjson
 import torch
 import argparse
 from transformers import AutoTokenizer, AutoModelForSequenceClassification
@@ -13,23 +14,44 @@ DATA_DIR = PROJECT_ROOT / "data"
 OUTPUT_DIR = DATA_DIR / "outputs"
 SENTENCE_FILE = "refined_sentences.json"
 
+
+def _normalize_sentence(s):
+    return " ".join(s.lower().split())
+
+
+def _unique_sentences(sentences):
+    # first occurrence wins; case/whitespace variants would score the same
+    unique = {}
+    for s in sentences:
+        key = _normalize_sentence(s)
+        if key and key not in unique:
+            unique[key] = s
+    return list(unique.values())
+
+
+@lru_cache(maxsize=4)
+def _load_model(model_path):
+    # loaded once per process, reused across projects
+    tokenizer = AutoTokenizer.from_pretrained(model_path)
+    model = AutoModelForSequenceClassification.from_pretrained(model_path)
+    model.eval()
+    return tokenizer, model
+
+
 def predict_SDG1_impact(model_name, project_id):
     # 1. Load the dataset to find the project text
     model_path = MODELS_DIR / model_name
     proj_path = OUTPUT_DIR / project_id
     sentences_path = proj_path / SENTENCE_FILE
     threshold = 0.60
-    with open(sentences_path, 'r') as f:
-     json_data = json.load(f) 
-    sentences = json_data["SDG_1_No_Poverty"]
+    json_data = orjson.loads(sentences_path.read_bytes())
+    sentences = _unique_sentences(json_data["SDG_1_No_Poverty"])
     print(f"\nAnalyzing Project ID: {project_id}")
 
     # 2. Load Model and Tokenizer
-    tokenizer = AutoTokenizer.from_pretrained(model_path)
-    model = AutoModelForSequenceClassification.from_pretrained(model_path)
+    tokenizer, model = _load_model(str(model_path))
 
     # 3. Perform Inference
-    model.eval()
     labels = ['O1', 'O2', 'O3', 'O5', 'O6', 'R3', 'R4', 'R5', 'R6', 'I1', 'I3', 'I5']
     rule_evidence = {label: [] for label in labels}
     # class_names = model.config.id2label
@@ -59,8 +81,7 @@ def predict_SDG1_impact(model_name, project_id):
     output_path = proj_path / output_filename
     output_path.parent.mkdir(parents=True, exist_ok=True) # Ensure folder exists
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(final_output, f, indent=4)
+    output_path.write_bytes(orjson.dumps(final_output, option=orjson.OPT_INDENT_2))
 
     print(f"Evidence saved to: {output_path}")
     return final_output
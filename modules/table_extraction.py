@@ -11,6 +11,7 @@ from config.settings import logger
 
 
 NUMERIC_ONLY_RE = re.compile(r"^[\d\s.,%()\-+/]+$")
+DEDUPE_PUNCT_RE = re.compile(r"[,:;|•·—–\-_/()\[\]{}]+")
 
 
 def _clean_cell(val: str) -> str:
@@ -23,17 +24,12 @@ def _clean_header(val: str, idx: int) -> str:
     txt = _clean_cell(val)
     if not txt:
         return f"col_{idx+1}"
-    txt = txt.lower()
-    txt = re.sub(r"\s+", "_", txt)
-    return txt
+    return "_".join(txt.lower().split())
 
 
 def _normalize_for_dedupe(text: str) -> str:
-    t = text.lower().strip()
-    t = re.sub(r"\s+", " ", t)
-    t = re.sub(r"[,:;|•·—–\-_/()\[\]{}]+", " ", t)
-    t = re.sub(r"\s+", " ", t).strip()
-    return t
+    t = DEDUPE_PUNCT_RE.sub(" ", text.lower())
+    return " ".join(t.split())
 
 
 def _extract_lattice_page(pdf_path: str, pdf_name: str, page: int) -> List[Dict[str, str]]:
@@ -81,18 +77,18 @@ def _extract_lattice_page(pdf_path: str, pdf_name: str, page: int) -> List[Dict[
 
 
 def extract_table_sentences(pdf_path: str, pdf_name: str) -> List[Dict[str, str]]:
-    logger.info(f"[TABLE] Extracting tables from {pdf_name} ({pdf_path})")
+    logger.info("[TABLE] Extracting tables from %s (%s)", pdf_name, pdf_path)
 
     try:
         num_pages = len(PdfReader(pdf_path).pages)
     except Exception as e:
-        logger.error(f"[TABLE] Failed to read page count for {pdf_name}: {e}")
+        logger.error("[TABLE] Failed to read page count for %s: %s", pdf_name, e)
         return []
 
-    logger.info(f"[TABLE] PDF pages: {num_pages}")
+    logger.info("[TABLE] PDF pages: %d", num_pages)
 
     workers = max(1, (os.cpu_count() or 2) - 1)
-    logger.info(f"[TABLE] Using {workers} parallel workers (lattice-only)")
+    logger.info("[TABLE] Using %d parallel workers (lattice-only)", workers)
 
     results: List[Dict[str, str]] = []
 
@@ -105,7 +101,7 @@ def extract_table_sentences(pdf_path: str, pdf_name: str) -> List[Dict[str, str]
             try:
                 results.extend(fut.result())
             except Exception as e:
-                logger.warning(f"[TABLE] Page extraction failed in {pdf_name}: {e}")
+                logger.warning("[TABLE] Page extraction failed in %s: %s", pdf_name, e)
 
     # Global normalized dedupe
     seen = set()
@@ -117,5 +113,5 @@ def extract_table_sentences(pdf_path: str, pdf_name: str) -> List[Dict[str, str]
         seen.add(key)
         final.append(r)
 
-    logger.info(f"[TABLE] Extracted {len(final)} table sentences from {pdf_name}.")
+    logger.info("[TABLE] Extracted %d table sentences from %s.", len(final), pdf_name)
     return final
\ No newline at end of file
@@ -1,15 +1,22 @@
 from modules.pdf_extraction import load_pdfs
-from modules.cleaning import split_into_sentences, clean_sentence
+from modules.cleaning import split_many, clean_sentence
 from modules.factor_matching import match_factors
 from modules.scoring import aggregate_by_sdg
 from modules.assessment import assess_factors_from_refined
 from modules.table_extraction import extract_table_sentences
 from modules.evidence_refiner import refine_evidence, refine_table_evidence, _dedupe_preserve_order
-from config.settings import BASE_OUTPUT_DIR
+from config.settings import settings
 
-import json
 import os
 
+import orjson
+
+
+def _write_json(path: str, data) -> None:
+    with open(path, "wb") as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+
+
 def run_pipeline(project_name: str):
     print(f"\n==============================")
     print(f"[PIPELINE] Project: {project_name}")
@@ -20,8 +27,8 @@ def run_pipeline(project_name: str):
     text_sentences = []
     table_sentences = []
 
-    for doc in docs:
-        for sent in split_into_sentences(doc["text"]):
+    for doc, sents in zip(docs, split_many([d["text"] for d in docs])):
+        for sent in sents:
             cleaned = clean_sentence(sent)
             if cleaned:
                 text_sentences.append({"pdf": doc["filename"], "text": cleaned})
@@ -65,24 +72,19 @@ def run_pipeline(project_name: str):
 
 
     # Per-project output folder
-    output_dir = os.path.join(BASE_OUTPUT_DIR, project_name)
+    output_dir = os.path.join(settings.base_output_dir, project_name)
     os.makedirs(output_dir, exist_ok=True)
 
-    with open(os.path.join(output_dir, "text_factor_sentences.json"), "w", encoding="utf-8") as f:
-        json.dump(text_matches, f, ensure_ascii=False, indent=2)
+    _write_json(os.path.join(output_dir, "text_factor_sentences.json"), text_matches)
 
-    with open(os.path.join(output_dir, "table_factor_sentences.json"), "w", encoding="utf-8") as f:
-        json.dump(table_matches, f, ensure_ascii=False, indent=2)
+    _write_json(os.path.join(output_dir, "table_factor_sentences.json"), table_matches)
 
-    with open(os.path.join(output_dir, "refined_sentences.json"), "w", encoding="utf-8") as f:
-        json.dump(final_evidence, f, ensure_ascii=False, indent=2)
+    _write_json(os.path.join(output_dir, "refined_sentences.json"), final_evidence)
 
-    with open(os.path.join(output_dir, "assessments.json"), "w", encoding="utf-8") as f:
-        json.dump(assessments, f, ensure_ascii=False, indent=2)
+    _write_json(os.path.join(output_dir, "assessments.json"), assessments)
 
     sdg_aggregation = aggregate_by_sdg(assessments)
-    with open(os.path.join(output_dir, "sdg_ratings.json"), "w", encoding="utf-8") as f:
-        json.dump(sdg_aggregation, f, ensure_ascii=False, indent=2)
+    _write_json(os.path.join(output_dir, "sdg_ratings.json"), sdg_aggregation)
 
     print(f"[INFO] Overall SDG rating for {project_name}: {sdg_aggregation['overall']}")
     print("[SUCCESS] Pipeline finished for", project_name)